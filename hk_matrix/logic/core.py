@@ -1,9 +1,67 @@
 from __future__ import annotations
+import ast
+import io
+import re
+import warnings
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
 import numpy as np
-from sympy import Matrix, Rational
+from sympy import Matrix, Rational, S
+
+try:
+    from numba import njit  # opcional: acelera la ruta numérica
+except Exception:
+    njit = None
+
+_SPLIT_ROWS = re.compile(r"[;\n]+")
+_SPLIT_TOKENS = re.compile(r"[\s,]+")
+_TILE = 64  # tamaño de bloque para recorrer productos grandes
+
+
+@dataclass(frozen=True)
+class LazyStep:
+    """Instantánea perezosa: matriz base compartida + primeras `n` celdas modificadas.
+
+    Todos los pasos de una misma operación comparten `base` y `overrides`, así que
+    cada paso ocupa O(1) memoria; la matriz solo se materializa al mostrarla.
+    """
+    base: np.ndarray
+    overrides: list
+    n: int
+
+    def to_array(self) -> np.ndarray:
+        arr = self.base.copy()
+        for i, j, val in self.overrides[:self.n]:
+            arr[i, j] = val
+        return arr
+
+    def tolist(self):
+        return self.to_array().tolist()
+
+    def to_matrix(self) -> Matrix:
+        return Matrix(self.tolist())
+
+    def __str__(self):
+        return str(self.to_matrix())
+
+def _fast_parse_rows(s: str):
+    """Parseo en C (genfromtxt) de filas separadas por ';'/saltos y números por espacios/comas.
+
+    Devuelve None si la entrada no es una tabla numérica rectangular limpia.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            arr = np.genfromtxt(io.StringIO(s.replace(";", "\n").replace(",", " ")),
+                                dtype=float, comments=None, ndmin=2)
+    except Exception:
+        return None
+    if arr.ndim != 2 or arr.size == 0 or np.isnan(arr).any():
+        return None
+    return arr
 
 def parse_matrix(text: str) -> np.ndarray:
-    import ast, re
     s = text.strip()
     if not s:
         raise ValueError("Entrada vacía")
@@ -15,9 +73,12 @@ def parse_matrix(text: str) -> np.ndarray:
         return arr
     except Exception:
         pass
+    arr = _fast_parse_rows(s)
+    if arr is not None:
+        return arr
     rows = []
-    for line in filter(None, [part.strip() for part in re.split(r"[;\n]+", s)]):
-        tokens = [t for t in re.split(r"[\s,]+", line) if t]
+    for line in filter(None, [part.strip() for part in _SPLIT_ROWS.split(s)]):
+        tokens = [t for t in _SPLIT_TOKENS.split(line) if t]
         rows.append([float(t) for t in tokens])
     if not rows:
         raise ValueError("No se pudo interpretar la matriz")
@@ -27,7 +88,8 @@ def parse_matrix(text: str) -> np.ndarray:
     return np.array(rows, dtype=float)
 
 def parse_vectors(text: str) -> np.ndarray:
-    import ast, re
+    """Vectores como columnas. Puede devolver una vista transpuesta: usar
+    np.ascontiguousarray si el llamador necesita memoria contigua."""
     s = text.strip()
     if not s:
         raise ValueError("Entrada vacía")
@@ -41,183 +103,310 @@ def parse_vectors(text: str) -> np.ndarray:
         return arr.T
     except Exception:
         pass
+    arr = _fast_parse_rows(s)
+    if arr is not None:
+        return arr.T
     vecs = []
-    for line in filter(None, [part.strip() for part in re.split(r"[;\n]+", s)]):
-        tokens = [t for t in re.split(r"[\s,]+", line) if t]
+    for line in filter(None, [part.strip() for part in _SPLIT_ROWS.split(s)]):
+        tokens = [t for t in _SPLIT_TOKENS.split(line) if t]
         vecs.append([float(t) for t in tokens])
     if not vecs:
         raise ValueError("No se pudo interpretar los vectores")
     dim = len(vecs[0])
     if any(len(v) != dim for v in vecs):
         raise ValueError("Todos los vectores deben tener la misma dimensión")
-    return np.array(vecs, dtype=float).T
+    # Cada vector es una columna: se llena (dim, k) directamente, contiguo en memoria
+    out = np.empty((dim, len(vecs)), dtype=float)
+    for k, v in enumerate(vecs):
+        out[:, k] = v
+    return out
+
+@lru_cache(maxsize=1024)
+def _rat(x: float, decimal: bool = False) -> Rational:
+    """Rational exacto de x (lectura decimal de str(x) con decimal=True)."""
+    return Rational(str(x)) if decimal else Rational(x)
+
+def _is_integral(A: np.ndarray) -> bool:
+    """True si todas las entradas son enteros representables exactamente en float."""
+    return bool(np.all(np.isfinite(A)) and np.all(np.abs(A) < 2**53) and np.all(A == np.round(A)))
+
+def _to_rational_matrix(A: np.ndarray, decimal: bool = False) -> Matrix:
+    """Convierte un arreglo float a Matrix exacta (Integer si todo es entero)."""
+    A = np.asarray(A, dtype=float)
+    if A.ndim == 1:
+        A = A.reshape(-1, 1)
+    if _is_integral(A):
+        return Matrix(A.astype(np.int64).tolist())
+    return Matrix(A.shape[0], A.shape[1], [_rat(v, decimal) for v in A.ravel().tolist()])
+
+@dataclass(frozen=True)
+class RowSnapshot:
+    """Instantánea inmutable de una matriz como tupla de filas (tuplas).
+
+    Las filas que una operación no toca se comparten entre pasos, así que
+    cada paso cuesta O(filas) referencias en vez de copiar toda la matriz.
+    """
+    rows: tuple
+
+    def to_array(self) -> np.ndarray:
+        return np.array(self.rows, dtype=float)
+
+    def tolist(self):
+        return [list(row) for row in self.rows]
+
+    def to_matrix(self) -> Matrix:
+        return Matrix(self.tolist())
+
+    def __str__(self):
+        return str(self.to_matrix())
+
+def step_array(m) -> np.ndarray:
+    """Matriz float de un paso (ndarray, LazyStep, RowSnapshot o Matrix de sympy)."""
+    if isinstance(m, np.ndarray):
+        return m.astype(float, copy=False)
+    if hasattr(m, 'to_array'):
+        return m.to_array()
+    return _sympy_to_ndarray(m)
+
+def _sympy_to_ndarray(m) -> np.ndarray:
+    """Matrix de sympy -> ndarray float sin pasar por listas anidadas.
+
+    Con dominio ZZ/QQ los elementos planos de la DomainMatrix son enteros/MPQ
+    nativos, cuyo float() es mucho más barato que el de los objetos de sympy.
+    """
+    try:
+        flat = m._rep.to_list_flat()
+        return np.fromiter(map(float, flat), float, len(flat)).reshape(m.shape)
+    except (AttributeError, TypeError, ValueError):
+        pass
+    try:
+        return np.asarray(m, dtype=float)
+    except (TypeError, ValueError):
+        return np.array(m.tolist(), dtype=float)
+
+@lru_cache(maxsize=32)
+def _identity_rows(n: int, fraction: bool = False) -> tuple:
+    one, zero = (Fraction(1), Fraction(0)) if fraction else (S.One, S.Zero)
+    return tuple(tuple(one if i == j else zero for j in range(n)) for i in range(n))
+
+def _nonzero_mask(M: list, cols: int) -> np.ndarray:
+    """Máscara booleana de entradas no nulas, paralela a la lista de filas."""
+    return np.array([[v != 0 for v in row] for row in M], dtype=bool).reshape(len(M), cols)
+
+def _first_pivot(nz: np.ndarray, r: int, c: int):
+    rel = np.flatnonzero(nz[r:, c])
+    return r + int(rel[0]) if rel.size else None
+
+def _rational_rows(A: np.ndarray) -> list:
+    """Filas exactas para la eliminación paso a paso.
+
+    Con entradas enteras se usa fractions.Fraction (aritmética exacta de la
+    stdlib, mucho más ligera que Rational de sympy); si no, Rational exacto.
+    Las descripciones no cambian: str(Fraction) y str(Rational) coinciden.
+    """
+    A = np.asarray(A, dtype=float)
+    if _is_integral(A):
+        return [tuple(map(Fraction, row)) for row in A.astype(np.int64).tolist()]
+    return [tuple(row) for row in _to_rational_matrix(A).tolist()]
 
 def fmt_num(x: float, decimals: int = 2) -> str:
     """Formato compacto: redondea a `decimals` y omite ceros si es entero."""
     v = round(float(x), decimals)
-    if abs(v - int(round(v))) < 10**(-decimals):
-        return str(int(round(v)))
+    iv = round(v)  # round() sin dígitos ya devuelve int
+    if abs(v - iv) < 10**(-decimals):
+        return str(iv)
     s = f"{v:.{decimals}f}".rstrip('0').rstrip('.')
     return s
 
+def fmt_array(arr: np.ndarray, decimals: int = 2) -> np.ndarray:
+    """Versión vectorizada de fmt_num: devuelve un arreglo de cadenas con la misma forma."""
+    arr = np.asarray(arr, dtype=float)
+    if not (np.isfinite(arr).all() and (np.abs(arr) < 2**62).all()):
+        # inf/nan o enteros enormes: se conserva el comportamiento de fmt_num
+        return np.vectorize(lambda x: fmt_num(x, decimals), otypes=[object])(arr).astype(str)
+    # "%.Nf" redondea igual que round(x, N); se reutiliza el texto ya formateado
+    txt = np.char.mod(f"%.{decimals}f", arr)
+    v = txt.astype(float)
+    ints = np.round(v)
+    is_int = np.abs(v - ints) < 10**(-decimals)
+    out = np.char.rstrip(np.char.rstrip(txt, "0"), ".") if decimals > 0 else txt
+    return np.where(is_int, ints.astype(np.int64).astype(str), out)
+
 def fmt_matrix(arr: np.ndarray, precision: int = 2) -> str:
     """Formatea matriz con números redondeados y sin ceros innecesarios."""
     if arr.size == 0:
         return "[]"
-    rows = []
-    for i in range(arr.shape[0]):
-        rows.append("[" + ", ".join(fmt_num(arr[i, j], precision) for j in range(arr.shape[1])) + "]")
+    cells = fmt_array(arr, precision)
+    rows = ["[" + ", ".join(row) + "]" for row in cells.tolist()]
     return "[" + ("\n ".join(rows)) + "]"
 
 def rref_steps(A: np.ndarray):
-    M = Matrix([[Rational(x) for x in row] for row in A.tolist()])
-    steps = [("Matriz inicial:", M.copy())]
-    rows, cols = M.rows, M.cols
+    M = _rational_rows(A)
+    nz = _nonzero_mask(M, A.shape[1])
+    steps = [("Matriz inicial:", RowSnapshot(tuple(M)))]
+    rows, cols = A.shape
     r = 0
     for c in range(cols):
         if r >= rows:
             break
-        piv = None
-        for i in range(r, rows):
-            if M[i, c] != 0:
-                piv = i; break
+        piv = _first_pivot(nz, r, c)
         if piv is None:
             continue
         if piv != r:
-            M.row_swap(piv, r)
-            steps.append((f"Intercambiar fila {piv+1} con fila {r+1}", M.copy()))
-        if M[r, c] != 1:
-            factor = M[r, c]
-            M.row_op(r, lambda v, j: v / factor)
-            steps.append((f"Dividir fila {r+1} por {factor}", M.copy()))
-        for i in range(rows):
-            if i != r and M[i, c] != 0:
-                factor = M[i, c]
-                M.row_op(i, lambda v, j: v - factor * M[r, j])
-                steps.append((f"R{i+1} <- R{i+1} - ({factor})*R{r+1}", M.copy()))
+            M[piv], M[r] = M[r], M[piv]; nz[[piv, r]] = nz[[r, piv]]
+            steps.append((f"Intercambiar fila {piv+1} con fila {r+1}", RowSnapshot(tuple(M))))
+        if M[r][c] != 1:
+            factor = M[r][c]
+            M[r] = tuple(v / factor for v in M[r])
+            steps.append((f"Dividir fila {r+1} por {factor}", RowSnapshot(tuple(M))))
+        pr = M[r]
+        for i in np.flatnonzero(nz[:, c]).tolist():
+            if i != r:
+                factor = M[i][c]
+                M[i] = tuple(v - factor * p for v, p in zip(M[i], pr))
+                nz[i] = [v != 0 for v in M[i]]
+                steps.append((f"R{i+1} <- R{i+1} - ({factor})*R{r+1}", RowSnapshot(tuple(M))))
         r += 1
-    steps.append(("Resultado: RREF", M.copy()))
+    steps.append(("Resultado: RREF", RowSnapshot(tuple(M))))
     return steps
 
 def add_steps(A: np.ndarray, B: np.ndarray):
+    A = np.asarray(A, dtype=float); B = np.asarray(B, dtype=float)
     r, c = A.shape
-    C = np.zeros((r, c), dtype=float)
-    steps = [("Matriz resultado inicial (ceros)", Matrix(C.tolist()))]
+    C = A + B
+    base = np.zeros((r, c), dtype=float)
+    overrides = []
+    steps = [("Matriz resultado inicial (ceros)", LazyStep(base, overrides, 0))]
+    A_str = fmt_array(A, 2).tolist(); B_str = fmt_array(B, 2).tolist(); C_str = fmt_array(C, 2).tolist()
     for i in range(r):
         for j in range(c):
-            a = float(A[i, j]); b = float(B[i, j])
-            val = a + b
-            C[i, j] = val
+            overrides.append((i, j, float(C[i, j])))
             desc = (
-                f"Calcular C[{i+1},{j+1}] = {fmt_num(a,2)} [{i+1},{j+1}] + "
-                f"{fmt_num(b,2)} [{i+1},{j+1}] = {fmt_num(val,2)}"
+                f"Calcular C[{i+1},{j+1}] = {A_str[i][j]} [{i+1},{j+1}] + "
+                f"{B_str[i][j]} [{i+1},{j+1}] = {C_str[i][j]}"
             )
-            steps.append((desc, Matrix(C.tolist())))
-    steps.append(("Suma completa A + B", Matrix(C.tolist())))
+            steps.append((desc, LazyStep(base, overrides, len(overrides))))
+    steps.append(("Suma completa A + B", LazyStep(base, overrides, len(overrides))))
     return steps
 
 def sub_steps(A: np.ndarray, B: np.ndarray):
+    A = np.asarray(A, dtype=float); B = np.asarray(B, dtype=float)
     r, c = A.shape
-    C = np.zeros((r, c), dtype=float)
-    steps = [("Matriz resultado inicial (ceros)", Matrix(C.tolist()))]
+    C = A - B
+    base = np.zeros((r, c), dtype=float)
+    overrides = []
+    steps = [("Matriz resultado inicial (ceros)", LazyStep(base, overrides, 0))]
+    A_str = fmt_array(A, 2).tolist(); B_str = fmt_array(B, 2).tolist(); C_str = fmt_array(C, 2).tolist()
     for i in range(r):
         for j in range(c):
-            a = float(A[i, j]); b = float(B[i, j])
-            val = a - b
-            C[i, j] = val
+            overrides.append((i, j, float(C[i, j])))
             desc = (
-                f"Calcular C[{i+1},{j+1}] = {fmt_num(a,2)} [{i+1},{j+1}] - "
-                f"{fmt_num(b,2)} [{i+1},{j+1}] = {fmt_num(val,2)}"
+                f"Calcular C[{i+1},{j+1}] = {A_str[i][j]} [{i+1},{j+1}] - "
+                f"{B_str[i][j]} [{i+1},{j+1}] = {C_str[i][j]}"
             )
-            steps.append((desc, Matrix(C.tolist())))
-    steps.append(("Resta completa A - B", Matrix(C.tolist())))
+            steps.append((desc, LazyStep(base, overrides, len(overrides))))
+    steps.append(("Resta completa A - B", LazyStep(base, overrides, len(overrides))))
     return steps
 
 def multiply_steps(A: np.ndarray, B: np.ndarray):
+    A = np.asarray(A, dtype=float); B = np.asarray(B, dtype=float)
     r, n = A.shape
     _, c = B.shape
-    C = np.zeros((r, c), dtype=float)
-    steps = [("Matriz resultado inicial (ceros)", Matrix(C.tolist()))]
+    # El producto se calcula de una vez (BLAS); el bucle solo describe los pasos
+    C_full = A @ B
+    # Cada número se formatea una sola vez (A ya con su '*'); los términos solo concatenan
+    A_fmt = np.char.add(np.char.mod("%.2f", A), "*").tolist()
+    Bt_fmt = np.char.mod("%.2f", np.ascontiguousarray(B.T)).tolist()
+    C_fmt = np.char.mod("%.2f", C_full).tolist()
+    # Descripciones por bloques (_TILE x _TILE) para reutilizar filas de A y
+    # columnas de B mientras siguen en caché; los pasos se emiten fila por fila.
+    descs = [None] * (r * c)
+    for i0 in range(0, r, _TILE):
+        for j0 in range(0, c, _TILE):
+            for i in range(i0, min(i0 + _TILE, r)):
+                Ai = A_fmt[i]
+                for j in range(j0, min(j0 + _TILE, c)):
+                    terms = [a + b for a, b in zip(Ai, Bt_fmt[j])]
+                    descs[i * c + j] = f"Calcular C[{i+1},{j+1}] = " + " + ".join(terms) + f" = {C_fmt[i][j]}"
+    base = np.zeros((r, c), dtype=float)
+    overrides = []
+    steps = [("Matriz resultado inicial (ceros)", LazyStep(base, overrides, 0))]
     for i in range(r):
         for j in range(c):
-            val = float(np.sum([A[i,k]*B[k,j] for k in range(n)]))
-            C[i,j] = val
-            terms = [f"{A[i,k]:.2f}*{B[k,j]:.2f}" for k in range(n)]
-            desc = f"Calcular C[{i+1},{j+1}] = " + " + ".join(terms) + f" = {val:.2f}"
-            steps.append((desc, Matrix(C.tolist())))
-    steps.append(("Producto completo A·B", Matrix(C.tolist())))
+            overrides.append((i, j, float(C_full[i, j])))
+            steps.append((descs[i * c + j], LazyStep(base, overrides, len(overrides))))
+    steps.append(("Producto completo A·B", LazyStep(base, overrides, len(overrides))))
     return steps
 
 def upper_triangular_steps(A: np.ndarray):
-    M = Matrix([[Rational(x) for x in row] for row in A.tolist()])
-    steps = [("Matriz inicial", M.copy())]
-    rows, cols = M.rows, M.cols
+    M = _rational_rows(A)
+    nz = _nonzero_mask(M, A.shape[1])
+    steps = [("Matriz inicial", RowSnapshot(tuple(M)))]
+    rows, cols = A.shape
     r = 0
     for c in range(cols):
         if r >= rows:
             break
-        piv = None
-        for i in range(r, rows):
-            if M[i, c] != 0:
-                piv = i; break
+        piv = _first_pivot(nz, r, c)
         if piv is None:
             continue
         if piv != r:
-            M.row_swap(piv, r)
-            steps.append((f"Intercambiar fila {piv+1} con fila {r+1}", M.copy()))
-        for i in range(r+1, rows):
-            if M[i, c] != 0:
-                factor = M[i, c] / M[r, c]
-                M.row_op(i, lambda v, j: v - factor * M[r, j])
-                steps.append((f"R{i+1} <- R{i+1} - ({factor})*R{r+1}", M.copy()))
+            M[piv], M[r] = M[r], M[piv]; nz[[piv, r]] = nz[[r, piv]]
+            steps.append((f"Intercambiar fila {piv+1} con fila {r+1}", RowSnapshot(tuple(M))))
+        pr = M[r]
+        for i in (r + 1 + np.flatnonzero(nz[r+1:, c])).tolist():
+            factor = M[i][c] / pr[c]
+            M[i] = tuple(v - factor * p for v, p in zip(M[i], pr))
+            nz[i] = [v != 0 for v in M[i]]
+            steps.append((f"R{i+1} <- R{i+1} - ({factor})*R{r+1}", RowSnapshot(tuple(M))))
         r += 1
-    steps.append(("Resultado: U (triangular superior)", M.copy()))
+    steps.append(("Resultado: U (triangular superior)", RowSnapshot(tuple(M))))
     return steps
 
 def transpose_steps(A: np.ndarray):
     M = Matrix(A.tolist())
     steps = [("Matriz original A", M.copy())]
-    steps.append(("Transponer: A^T (filas↔columnas)", M.T.copy()))
+    steps.append(("Transponer: A^T (filas↔columnas)", M.T))
     return steps
 
 def inverse_steps(A: np.ndarray):
     # Método por matriz aumentada [A|I] y operaciones elementales
     if A.shape[0] != A.shape[1]:
         return [("La matriz no es cuadrada, no existe inversa.", Matrix(A.tolist()))]
-    M = Matrix([[Rational(x) for x in row] for row in A.tolist()])
-    n = M.rows
-    Aug = M.row_join(Matrix.eye(n))
-    steps = [("Matriz aumentada [A|I]", Aug.copy())]
+    n = A.shape[0]
+    rows = _rational_rows(A)
+    eye = _identity_rows(n, fraction=bool(rows) and isinstance(rows[0][0], Fraction))
+    Aug = [row + eye[i] for i, row in enumerate(rows)]
+    nz = _nonzero_mask(Aug, 2 * n)
+    steps = [("Matriz aumentada [A|I]", RowSnapshot(tuple(Aug)))]
     r = 0
     for c in range(n):
         if r >= n: break
-        piv = None
-        for i in range(r, n):
-            if Aug[i, c] != 0:
-                piv = i; break
+        piv = _first_pivot(nz, r, c)
         if piv is None: continue
         if piv != r:
-            Aug.row_swap(piv, r)
-            steps.append((f"Intercambiar fila {piv+1} con fila {r+1}", Aug.copy()))
-        if Aug[r, c] != 1:
-            factor = Aug[r, c]
-            Aug.row_op(r, lambda v, j: v / factor)
-            steps.append((f"Dividir fila {r+1} por {factor}", Aug.copy()))
-        for i in range(n):
-            if i != r and Aug[i, c] != 0:
-                factor = Aug[i, c]
-                Aug.row_op(i, lambda v, j: v - factor * Aug[r, j])
-                steps.append((f"R{i+1} <- R{i+1} - ({factor})*R{r+1}", Aug.copy()))
+            Aug[piv], Aug[r] = Aug[r], Aug[piv]; nz[[piv, r]] = nz[[r, piv]]
+            steps.append((f"Intercambiar fila {piv+1} con fila {r+1}", RowSnapshot(tuple(Aug))))
+        if Aug[r][c] != 1:
+            factor = Aug[r][c]
+            Aug[r] = tuple(v / factor for v in Aug[r])
+            steps.append((f"Dividir fila {r+1} por {factor}", RowSnapshot(tuple(Aug))))
+        pr = Aug[r]
+        for i in np.flatnonzero(nz[:, c]).tolist():
+            if i != r:
+                factor = Aug[i][c]
+                Aug[i] = tuple(v - factor * p for v, p in zip(Aug[i], pr))
+                nz[i] = [v != 0 for v in Aug[i]]
+                steps.append((f"R{i+1} <- R{i+1} - ({factor})*R{r+1}", RowSnapshot(tuple(Aug))))
         r += 1
-    left = Aug[:, :n]
-    right = Aug[:, n:]
-    if left == Matrix.eye(n):
-        steps.append(("Izquierda = I: la derecha es A^{-1}", Aug.copy()))
+    # Gauss-Jordan deja I a la izquierda exactamente cuando hubo pivote en las n columnas
+    if r == n:
+        steps.append(("Izquierda = I: la derecha es A^{-1}", RowSnapshot(tuple(Aug))))
     else:
-        steps.append(("La izquierda no es I ⇒ A no es invertible", Aug.copy()))
+        steps.append(("La izquierda no es I ⇒ A no es invertible", RowSnapshot(tuple(Aug))))
     return steps
 
-def cramer_steps(A: np.ndarray, b: np.ndarray):
+def cramer_steps(A: np.ndarray, b: np.ndarray, compute_column_dets: bool = True):
     """Resuelve Ax = b utilizando el método de Cramer.
 
     Devuelve una tupla (solucion, pasos, detA, det_columnas, solucion_exacta)
@@ -225,6 +414,8 @@ def cramer_steps(A: np.ndarray, b: np.ndarray):
     x, "pasos" es la bitácora simbólica para mostrar en la UI, "detA" es el
     determinante de la matriz de coeficientes, "det_columnas" contiene los
     determinantes de las matrices A_i y "solucion_exacta" la solución simbólica.
+    Los det(A_i) se obtienen como det(A)·x_i a partir de una sola factorización
+    LU; con compute_column_dets=False se omiten (det_columnas = []).
     """
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float)
@@ -238,74 +429,238 @@ def cramer_steps(A: np.ndarray, b: np.ndarray):
     if b.shape[0] != n:
         raise ValueError("El vector b debe tener tantas filas como A.")
 
-    def _to_rational_matrix(mat: np.ndarray) -> Matrix:
-        return Matrix([[Rational(str(val)) for val in row] for row in mat.tolist()])
-
-    coeff = _to_rational_matrix(A)
-    vec = Matrix([[Rational(str(val))] for val in b.flatten().tolist()])
-    augmented = coeff.row_join(vec)
-    steps = [("Sistema aumentado [A|b]", augmented.copy())]
+    coeff = _to_rational_matrix(A, decimal=True)
+    vec = _to_rational_matrix(b, decimal=True)
+    coeff_snap = RowSnapshot(tuple(map(tuple, coeff.tolist())))
+    steps = [("Sistema aumentado [A|b]", RowSnapshot(tuple(map(tuple, coeff.row_join(vec).tolist()))))]
 
-    detA = coeff.det()
-    steps.append((f"det(A) = {detA}", coeff.copy()))
-    if detA == 0:
-        steps.append(("det(A) = 0 ⇒ el método de Cramer no aplica (no hay solución única)", coeff.copy()))
+    # Una sola factorización LU exacta: det(A) = ±∏ U_ii y, con la misma L·U,
+    # la solución; x_i = det(A_i)/det(A)  ⇒  det(A_i) = det(A)·x_i
+    L, U, perm = coeff.LUdecomposition()
+    detA = S.One
+    for i in range(n):
+        detA *= U[i, i]
+    if len(perm) % 2:
+        detA = -detA
+    steps.append((f"det(A) = {detA}", coeff_snap))
+    if detA.is_zero:
+        steps.append(("det(A) = 0 ⇒ el método de Cramer no aplica (no hay solución única)", coeff_snap))
         return None, steps, detA, [], []
 
+    y = L.lower_triangular_solve(vec.permute_rows(perm))
+    solucion_exacta = list(U.upper_triangular_solve(y))
     det_columnas = []
-    solucion_exacta = []
-    for idx in range(n):
+    for idx in range(n if compute_column_dets else 0):
         Ai = coeff.copy()
         Ai[:, idx] = vec
-        steps.append((f"A_{idx+1}: reemplazar columna {idx+1} por b", Ai.copy()))
-        detAi = Ai.det()
+        snap = RowSnapshot(tuple(map(tuple, Ai.tolist())))
+        steps.append((f"A_{idx+1}: reemplazar columna {idx+1} por b", snap))
+        sol_i = solucion_exacta[idx]
+        detAi = detA * sol_i
         det_columnas.append(detAi)
-        steps.append((f"det(A_{idx+1}) = {detAi}", Ai.copy()))
-        sol_i = detAi / detA
-        solucion_exacta.append(sol_i)
+        steps.append((f"det(A_{idx+1}) = {detAi}", snap))
         steps.append((f"x_{idx+1} = det(A_{idx+1}) / det(A) = {detAi}/{detA}", Matrix([[sol_i]])))
 
     vector_sol = Matrix(solucion_exacta)
-    steps.append(("Vector solución x", vector_sol.copy()))
-    solucion = np.array([[float(val.evalf())] for val in solucion_exacta], dtype=float)
+    steps.append(("Vector solución x", vector_sol))
+    solucion = cramer_result(A, b)
+    if solucion is None:
+        # LAPACK la ve singular por redondeo: un solo evalf sobre el vector exacto
+        solucion = np.array(vector_sol.evalf().tolist(), dtype=float).reshape(-1, 1)
     return solucion, steps, detA, det_columnas, solucion_exacta
 
+def cramer_result(A: np.ndarray, b: np.ndarray):
+    """Solución numérica de Ax = b vía LAPACK; None si A es singular."""
+    b = np.asarray(b, dtype=float)
+    try:
+        return np.linalg.solve(np.asarray(A, dtype=float), b.reshape(-1, 1))
+    except np.linalg.LinAlgError:
+        return None
+
 
 def determinant_steps(A: np.ndarray):
     # Eliminación hacia triangular superior sin escalar filas
-    M = Matrix([[Rational(x) for x in row] for row in A.tolist()])
-    steps = [("Matriz inicial", M.copy())]
-    rows, cols = M.rows, M.cols
+    M = _rational_rows(A)
+    nz = _nonzero_mask(M, A.shape[1])
+    steps = [("Matriz inicial", RowSnapshot(tuple(M)))]
+    rows, cols = A.shape
     if rows != cols:
-        steps.append(("No es cuadrada ⇒ determinante no definido", M.copy()))
+        steps.append(("No es cuadrada ⇒ determinante no definido", RowSnapshot(tuple(M))))
         return steps
     swaps = 0
     r = 0
     for c in range(cols):
         if r >= rows: break
-        piv = None
-        for i in range(r, rows):
-            if M[i, c] != 0:
-                piv = i; break
+        piv = _first_pivot(nz, r, c)
         if piv is None: continue
         if piv != r:
-            M.row_swap(piv, r); swaps += 1
-            steps.append((f"Swap filas {piv+1}↔{r+1} (cambia signo del det)", M.copy()))
-        for i in range(r+1, rows):
-            if M[i, c] != 0:
-                factor = M[i, c] / M[r, c]
-                M.row_op(i, lambda v, j: v - factor * M[r, j])
-                steps.append((f"Eliminar debajo del pivote: R{i+1} <- R{i+1} - ({factor})*R{r+1}", M.copy()))
+            M[piv], M[r] = M[r], M[piv]; nz[[piv, r]] = nz[[r, piv]]; swaps += 1
+            steps.append((f"Swap filas {piv+1}↔{r+1} (cambia signo del det)", RowSnapshot(tuple(M))))
+        pr = M[r]
+        for i in (r + 1 + np.flatnonzero(nz[r+1:, c])).tolist():
+            factor = M[i][c] / pr[c]
+            M[i] = tuple(v - factor * p for v, p in zip(M[i], pr))
+            nz[i] = [v != 0 for v in M[i]]
+            steps.append((f"Eliminar debajo del pivote: R{i+1} <- R{i+1} - ({factor})*R{r+1}", RowSnapshot(tuple(M))))
         r += 1
-    det = Rational(1)
+    det = 1
     for i in range(rows):
-        det *= M[i, i]
+        det *= M[i][i]
     if swaps % 2 == 1:
         det = -det
-    steps.append((f"Determinante = producto diagonal * (-1)^swaps = {det}", M.copy()))
+    steps.append((f"Determinante = producto diagonal * (-1)^swaps = {det}", RowSnapshot(tuple(M))))
     return steps
+
+def _rref_numpy(R: np.ndarray, tol: float) -> int:
+    """Gauss-Jordan in-place con pivoteo parcial; devuelve el rango."""
+    rows, cols = R.shape
+    r = 0
+    for c in range(cols):
+        if r >= rows:
+            break
+        piv = r + int(np.argmax(np.abs(R[r:, c])))
+        if abs(R[piv, c]) <= tol:
+            R[r:, c] = 0.0
+            continue
+        if piv != r:
+            R[[r, piv]] = R[[piv, r]]
+        R[r] /= R[r, c]
+        others = np.arange(rows) != r
+        R[others] -= np.outer(R[others, c], R[r])
+        r += 1
+    return r
+
+if njit is not None:
+    @njit(cache=True)
+    def _rref_float(R, tol):
+        rows, cols = R.shape
+        r = 0
+        for c in range(cols):
+            if r >= rows:
+                break
+            piv = r
+            for i in range(r + 1, rows):
+                if abs(R[i, c]) > abs(R[piv, c]):
+                    piv = i
+            if abs(R[piv, c]) <= tol:
+                R[r:, c] = 0.0
+                continue
+            if piv != r:
+                for j in range(cols):
+                    R[r, j], R[piv, j] = R[piv, j], R[r, j]
+            R[r, :] /= R[r, c]
+            for i in range(rows):
+                if i != r:
+                    factor = R[i, c]
+                    if factor != 0.0:
+                        R[i, :] -= factor * R[r, :]
+            r += 1
+        return r
+else:
+    _rref_float = _rref_numpy
+
+def rref_result(A: np.ndarray, tol: float | None = None):
+    """RREF numérica (sin bitácora). Devuelve (R, rango).
+
+    La bitácora exacta con Rational sigue en rref_steps; aquí se usa el kernel
+    compilado con numba si está instalado.
+    """
+    R = np.array(A, dtype=np.float64, order="C")
+    rows, cols = R.shape
+    if tol is None:
+        tol = max(rows, cols) * np.finfo(float).eps * (np.abs(R).max() if R.size else 0.0)
+    r = _rref_float(R, float(tol))
+    R[np.abs(R) <= tol] = 0.0
+    return R, int(r)
+
+def determinant_result(A: np.ndarray) -> float:
+    """Determinante numérico vía LAPACK (LU).
+
+    Para n <= 3 se usa la fórmula cerrada: evita la llamada a LAPACK y, con
+    entradas enteras, da el valor exacto (sin residuos tipo -2.0000000000000004).
+    """
+    A = np.asarray(A, dtype=float)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("La matriz debe ser cuadrada.")
+    n = A.shape[0]
+    if n == 0:
+        return 1.0
+    if n == 1:
+        return float(A[0, 0])
+    if n == 2:
+        return float(A[0, 0] * A[1, 1] - A[0, 1] * A[1, 0])
+    if n == 3:
+        (a, b, c), (d, e, f), (g, h, i) = A.tolist()
+        return float(a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g))
+    return float(np.linalg.det(A))
+
+# A partir de este tamaño (A.size * B.size) el producto entero va por SGEMM
+_SGEMM_MIN_WORK = 1024
+
+def multiply_result(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Producto A·B numérico (BLAS), sin bitácora.
+
+    Con matrices enteras grandes cuyas sumas parciales caben exactas en float32
+    (|a|max·|b|max·n < 2**24) se usa SGEMM: mitad de bytes y mismo resultado.
+    """
+    A = np.asarray(A, dtype=float); B = np.asarray(B, dtype=float)
+    if A.size * B.size > _SGEMM_MIN_WORK and _is_integral(A) and _is_integral(B):
+        if np.abs(A).max() * np.abs(B).max() * A.shape[1] < 2**24:
+            A32 = np.ascontiguousarray(A, dtype=np.float32); B32 = np.ascontiguousarray(B, dtype=np.float32)
+            return (A32 @ B32).astype(np.float64)
+    return A @ B
+
+def bareiss_det(A: np.ndarray) -> int:
+    """Determinante exacto de una matriz entera con el algoritmo de Bareiss.
+
+    Eliminación libre de fracciones: todas las divisiones son exactas, así que
+    se trabaja con int de Python (sin desbordes ni Rational) en O(n^3).
+    """
+    M = np.asarray(A, dtype=float)
+    if M.ndim != 2 or M.shape[0] != M.shape[1]:
+        raise ValueError("La matriz debe ser cuadrada.")
+    if not _is_integral(M):
+        raise ValueError("bareiss_det requiere entradas enteras.")
+    M = [list(map(int, row)) for row in M.astype(np.int64).tolist()]
+    n = len(M)
+    sign, prev = 1, 1
+    for k in range(n - 1):
+        if M[k][k] == 0:
+            piv = next((i for i in range(k + 1, n) if M[i][k] != 0), None)
+            if piv is None:
+                return 0
+            M[k], M[piv] = M[piv], M[k]; sign = -sign
+        akk = M[k][k]; rk = M[k]
+        for i in range(k + 1, n):
+            ri = M[i]; aik = ri[k]
+            for j in range(k + 1, n):
+                ri[j] = (akk * ri[j] - aik * rk[j]) // prev
+        prev = akk
+    return sign * M[n - 1][n - 1] if n else 1
+
+@lru_cache(maxsize=8)
+def _inverse_cached(shape: tuple, data: bytes):
+    A = np.frombuffer(data, dtype=np.float64).reshape(shape)
+    try:
+        inv = np.linalg.inv(A)
+    except np.linalg.LinAlgError:
+        return None
+    inv.setflags(write=False)
+    return inv
+
+def inverse_result(A: np.ndarray):
+    """Inversa numérica vía LAPACK; None si la matriz es singular.
+
+    Se cachean las últimas 8 matrices por contenido: pulsar Calcular de nuevo
+    sobre la misma rejilla no repite la factorización.
+    """
+    A = np.ascontiguousarray(A, dtype=np.float64)
+    inv = _inverse_cached(A.shape, A.tobytes())
+    return None if inv is None else inv.copy()
+
 __all__ = [
-    'parse_matrix','parse_vectors','fmt_matrix','fmt_num',
+    'LazyStep','RowSnapshot','step_array','parse_matrix','parse_vectors','fmt_matrix','fmt_num','fmt_array',
     'rref_steps','add_steps','sub_steps','multiply_steps','upper_triangular_steps',
-    'transpose_steps','inverse_steps','determinant_steps','cramer_steps'
+    'transpose_steps','inverse_steps','determinant_steps','cramer_steps',
+    'rref_result','determinant_result','inverse_result','cramer_result','multiply_result','bareiss_det'
 ]
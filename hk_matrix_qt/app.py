@@ -1,7 +1,10 @@
 from __future__ import annotations
 import sys
 import os
+import re
 import html
+import weakref
+from functools import lru_cache
 from PySide6.QtGui import QFontDatabase, QFont
 from sympy import (
     symbols as _SYM_symbols,
@@ -12,20 +15,39 @@ from sympy import (
 import matplotlib as mpl
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
-from sympy import Matrix as SMatrix
 
 
-def _safe_sec(x):
-    return 1.0 / np.cos(x)
+def _inplace(ufunc, y):
+    """Aplica `ufunc` sobre el temporal propio `y` sin otro arreglo (escalares tal cual)."""
+    if isinstance(y, np.ndarray) and y.dtype.kind == 'f':
+        return ufunc(y, out=y)
+    return ufunc(y)
 
 
-def _safe_csc(x):
-    return 1.0 / np.sin(x)
+def _recip_of(f, x, out=None):
+    """1/f(x) en una sola pasada de memoria: f escribe en `out` (o en un temporal) y
+    el recíproco se hace en sitio, en lugar de 1.0 / f(x) con dos arreglos."""
+    y = f(x, out=out) if out is not None else f(x)
+    return _inplace(np.reciprocal, y)
 
 
-def _safe_cot(x):
-    return 1.0 / np.tan(x)
+def _safe_sec(x, out=None):
+    return _recip_of(np.cos, x, out)
+
+
+def _safe_csc(x, out=None):
+    return _recip_of(np.sin, x, out)
+
+
+def _safe_cot(x, out=None):
+    return _recip_of(np.tan, x, out)
+
+
+def _inv_arg(f, x):
+    """f(1/x) con el temporal 1/x reutilizado como salida."""
+    return _inplace(f, np.reciprocal(np.asarray(x, dtype=float)))
 
 
 _LAMBDA_EXTRA_FUNCS = {
@@ -34,18 +56,154 @@ _LAMBDA_EXTRA_FUNCS = {
     'csc': _safe_csc,
     'cot': _safe_cot,
     'cotg': _safe_cot,
-    'sech': lambda x: 1.0 / np.cosh(x),
-    'csch': lambda x: 1.0 / np.sinh(x),
-    'coth': lambda x: 1.0 / np.tanh(x),
-    'asec': lambda x: np.arccos(1.0 / x),
-    'acsc': lambda x: np.arcsin(1.0 / x),
-    'acot': lambda x: np.arctan(1.0 / x),
+    'sech': lambda x, out=None: _recip_of(np.cosh, x, out),
+    'csch': lambda x, out=None: _recip_of(np.sinh, x, out),
+    'coth': lambda x, out=None: _recip_of(np.tanh, x, out),
+    'asec': lambda x: _inv_arg(np.arccos, x),
+    'acsc': lambda x: _inv_arg(np.arcsin, x),
+    'acot': lambda x: _inv_arg(np.arctan, x),
 }
 
 _LAMBDA_MODULES = [_LAMBDA_EXTRA_FUNCS, 'numpy']
 
+# Opciones comunes de lambdify: CSE y, si la versión de sympy lo admite
+# (>= 1.13), sin el docstring generado, que imprime la expresión y el código fuente
+_LAMBDIFY_KW = {'cse': True}
+try:
+    import inspect as _inspect
+    if 'docstring_limit' in _inspect.signature(_SYM_lambdify).parameters:
+        _LAMBDIFY_KW['docstring_limit'] = 0
+except Exception:
+    pass
+
+try:
+    import numba as _numba  # opcional: compila f(x) para las gráficas
+except Exception:
+    _numba = None
+
+_ctypes = None
+if sys.platform == 'win32':
+    try:
+        import ctypes as _ctypes  # solo Windows: AppUserModelID de la barra de tareas
+    except Exception:
+        _ctypes = None
+_APP_ID_SET = False
+
+
+# Símbolo x compartido por todas las vistas de raíces (se crea una sola vez)
+_SYM_X = _SYM_symbols('x')
+
+
+@lru_cache(maxsize=128)
+def _parse_expr(expr_text: str):
+    """sympify cacheado por texto (las expresiones de sympy son inmutables)."""
+    return _SYM_sympify(expr_text)
+
+
+@lru_cache(maxsize=128)
+def _compile_sym(expr):
+    """lambdify numpy de una expresión ya parseada; la clave es la propia expresión (hashable)."""
+    return _SYM_lambdify(_SYM_X, expr, _LAMBDA_MODULES, **_LAMBDIFY_KW)
+
+
+@lru_cache(maxsize=64)
+def _compile_expr(expr_text: str):
+    """f(x) numérica (lambdify numpy) cacheada por el texto de la expresión."""
+    return _compile_sym(_parse_expr(expr_text))
+
+
+@lru_cache(maxsize=64)
+def _derivative(expr_text: str):
+    """f'(x) simbólica, derivada una sola vez por texto de f."""
+    return _SYM_diff(_parse_expr(expr_text), _SYM_X)
+
+
+def _numba_cache_dir() -> str:
+    """Carpeta privada (0700, del usuario) para los .py que numba cachea en disco."""
+    base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    if not base:
+        raise OSError('sin carpeta de caché de usuario')
+    folder = os.path.join(base, 'hk_matrix', 'numba')
+    os.makedirs(folder, mode=0o700, exist_ok=True)
+    if os.name == 'posix':
+        st = os.stat(folder)
+        if st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise PermissionError(f'carpeta de caché no privada: {folder}')
+    return folder
+
+
+def _numba_cached_kernel(scalar):
+    """Reescribe el lambdify 'math' en un .py real para que numba pueda usar cache=True.
+
+    El código de lambdify vive en '<lambdifygenerated-N>', así que la caché en disco
+    de numba no funciona; con un archivo estable (nombre = hash del fuente) la
+    compilación se reutiliza entre ejecuciones. Solo se ejecuta un archivo cuyo
+    contenido coincide con el fuente generado; si no, se reescribe de forma atómica.
+    """
+    import hashlib, importlib.util, inspect, tempfile
+    src = "from math import *\n\n" + inspect.getsource(scalar)
+    digest = hashlib.sha1(src.encode('utf-8')).hexdigest()[:16]
+    folder = _numba_cache_dir()
+    path = os.path.join(folder, f"expr_{digest}.py")
+    try:
+        with open(path, encoding='utf-8') as fh:
+            same = fh.read() == src
+    except OSError:
+        same = False
+    if not same:
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=folder)
+        with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+            fh.write(src)
+        os.replace(tmp, path)
+    spec = importlib.util.spec_from_file_location(f"hk_matrix_numba_{digest}", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return _numba.vectorize([_numba.float64(_numba.float64)], cache=True)(mod._lambdifygenerated)
+
+
+@lru_cache(maxsize=64)
+def _plot_function(expr_text: str):
+    """f(x) vectorizada para graficar, cacheada por texto.
+
+    Con numba instalado se compila a un ufunc nativo (con caché en disco si se
+    puede); si la expresión usa algo que numba no soporta se usa el lambdify de
+    numpy de siempre.
+    """
+    if _numba is not None:
+        try:
+            scalar = _SYM_lambdify(_SYM_X, _parse_expr(expr_text), 'math', **_LAMBDIFY_KW)
+            try:
+                compiled = _numba_cached_kernel(scalar)
+                compiled(np.zeros(1))
+            except Exception:
+                compiled = _numba.vectorize([_numba.float64(_numba.float64)])(scalar)
+                compiled(np.zeros(1))
+            return compiled
+        except Exception:
+            pass
+    return _compile_expr(expr_text)
+
+
+@lru_cache(maxsize=64)
+def _eval_curve(expr_text: str, xi: float, xu: float, n: int = 400):
+    """(xs, ys) de la curva en [xi, xu], cacheado; los arreglos son de solo lectura."""
+    xs = np.linspace(xi, xu, n)
+    ys = np.asarray(_plot_function(expr_text)(xs), dtype=float)
+    if ys.shape != xs.shape:
+        ys = np.broadcast_to(ys, xs.shape).copy()
+    xs.setflags(write=False); ys.setflags(write=False)
+    return xs, ys
+
 SECANT_DECIMALS = 6
 
+# Tarjetas de resultado clásicas que se conservan para reutilizar
+_CARD_POOL_SIZE = 16
+# Diálogos de detalles de bisección ocultos listos para reutilizar
+_DIALOG_POOL_SIZE = 4
+
+# Generador compartido (PCG64) para todos los rellenos aleatorios (matrices y f(x))
+_RNG = np.random.default_rng()
+
 # -------------------------------
 # Design system base (Fase 1)
 # -------------------------------
@@ -62,14 +220,19 @@ from hk_matrix.logic.core import (
     rref_steps, upper_triangular_steps,
     transpose_steps, inverse_steps,
     determinant_steps, cramer_steps,
+    rref_result, determinant_result, inverse_result, step_array, bareiss_det, multiply_result,
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QEasingCurve, QPropertyAnimation, QUrl, QLocale, QPoint,
+    QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, Signal, QStandardPaths
 )
-from PySide6.QtCore import Qt, QTimer, QEasingCurve, QPropertyAnimation, QUrl, QLocale, QPoint
 from PySide6.QtGui import (
-    QIcon, QColor, QKeySequence, QShortcut, QPixmap, QClipboard, QDesktopServices
+    QIcon, QColor, QBrush, QFont, QKeySequence, QShortcut, QPixmap, QPixmapCache, QPainter, QImage,
+    QClipboard, QDesktopServices, QPainterPath
 )
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QPushButton, QSpinBox, QLabel, QTableWidget, QTableWidgetItem, QLineEdit,
+    QPushButton, QSpinBox, QLabel, QTableWidget, QTableWidgetItem, QTableView, QHeaderView, QLineEdit,
     QListWidget, QListWidgetItem, QComboBox, QSplitter, QScrollArea,
     QDialog, QAbstractItemView, QCheckBox, QDoubleSpinBox, QToolButton,
     QProgressBar, QFrame, QGraphicsDropShadowEffect, QStackedWidget,
@@ -80,6 +243,225 @@ from urllib.parse import quote_plus as _url_quote_plus
 # Tipografía matemática monoespaciada utilizada en tablas y fórmulas sencillas
 MATH_FONT_STACK = "'Consolas','DejaVu Sans Mono','Courier New',monospace"
 
+# Hojas de estilo de _style_button (literales de módulo compartidos por todos los botones)
+_BTN_PRIMARY_QSS = """
+QPushButton {
+    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1, stop:0 #8b5cf6, stop:1 #7c3aed);
+    color: white;
+    font-weight: bold;
+    border-radius: 8px;
+    padding: 10px 20px;
+    border: none;
+    font-size: 13px;
+}
+QPushButton:hover {
+    background-color: #9370db;
+}
+QPushButton:pressed {
+    background-color: #6a4fc9;
+    padding-top: 12px; /* Efecto de hundirse */
+}
+"""
+
+_BTN_SECONDARY_QSS = """
+QPushButton {
+    background-color: transparent;
+    color: #a78bfa;
+    font-weight: 600;
+    border-radius: 8px;
+    padding: 8px 16px;
+    border: 2px solid #7c3aed;
+}
+QPushButton:hover {
+    background-color: #7c3aed;
+    color: white;
+}
+QPushButton:pressed {
+    background-color: #5b21b6;
+    border-color: #5b21b6;
+}
+"""
+
+# Barra de título (fondo, botones min/max y botón de cierre)
+_TITLEBAR_QSS = "#titleBar{background-color:#1e1e2e; border-bottom:1px solid #333333;}"
+_TITLEBAR_BTN_QSS = (
+    "QPushButton{background:transparent; color:#c3c8d4; border:none;}"
+    "QPushButton:hover{background-color:rgba(255,255,255,0.08);}"
+)
+_TITLEBAR_CLOSE_QSS = (
+    "QPushButton{background:transparent; color:#c3c8d4; border:none;}"
+    "QPushButton:hover{background-color:#ff4b4b; color:#ffffff;}"
+)
+
+_SETTINGS_QSS = """
+    QDialog {
+        background-color: #1e1e2e;
+        color: #f5f5ff;
+    }
+    QGroupBox {
+        border: 1px solid #333;
+        border-radius: 8px;
+        margin-top: 10px;
+        font-weight: 600;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 8px;
+        padding: 0 4px;
+        color: #a78bfa;
+    }
+    QPushButton {
+        background-color: #7f5af0;
+        color:white;
+        border-radius: 6px;
+        padding: 6px 14px;
+        border:none;
+    }
+    QPushButton:hover {
+        background-color: #9b6bff;
+    }
+"""
+
+_SETTINGS_OVERLAY_QSS = (
+    "QLabel{"
+    "  background-color: rgba(0, 0, 0, 180);"
+    "  color: #ffffff;"
+    "  font-size: 18px;"
+    "  font-weight: 700;"
+    "  border-radius: 10px;"
+    "}"
+)
+
+# Glifos usados en botones que se crean una y otra vez (tarjetas, diálogos)
+_EMOJI_GLYPHS = ('📋', '🔍', '🗑️', '◀', '▶')
+_EMOJI_ICONS: dict[tuple[str, int, float], QIcon] = {}
+
+
+def _screen_dpr() -> float:
+    """Mayor devicePixelRatio entre las pantallas (1.0 sin QApplication)."""
+    try:
+        return max((scr.devicePixelRatio() for scr in QApplication.screens()), default=1.0)
+    except Exception:
+        return 1.0
+
+
+def _emoji_icon(glyph: str, size: int = 24) -> QIcon:
+    """QIcon con el glifo pre-renderizado una sola vez por tamaño (QPixmapCache + dict).
+
+    Se pinta a size * devicePixelRatio para que se vea nítido en pantallas HiDPI.
+    """
+    dpr = _screen_dpr()
+    ikey = (glyph, size, dpr)
+    icon = _EMOJI_ICONS.get(ikey)
+    if icon is not None:
+        return icon
+    key = f"hk_emoji:{glyph}:{size}@{dpr:g}"
+    pix = QPixmapCache.find(key)
+    if pix is None or pix.isNull():
+        px = max(1, round(size * dpr))
+        pix = QPixmap(px, px)
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.transparent)
+        painter = QPainter(pix)
+        font = QFont(); font.setPixelSize(int(size * 0.75))
+        painter.setFont(font)
+        painter.setPen(QColor('#fffffe'))
+        # Coordenadas lógicas: el painter ya escala por el dpr del pixmap
+        painter.drawText(0, 0, size, size, Qt.AlignCenter, glyph)
+        painter.end()
+        QPixmapCache.insert(key, pix)
+    icon = QIcon(pix)
+    _EMOJI_ICONS[ikey] = icon
+    return icon
+
+
+# logo.png se decodifica una sola vez; splash, ventanas y barra de título lo comparten
+_LOGO_PIXMAPS: dict[int, QPixmap] = {}
+_LOGO_ICON: QIcon | None = None
+
+
+def _logo_pixmap(size: int = 0) -> QPixmap:
+    """Logo como QPixmap (tamaño original con size=0), escalado suave una vez por tamaño."""
+    pix = _LOGO_PIXMAPS.get(size)
+    if pix is None:
+        if size:
+            base = _logo_pixmap(0)
+            pix = base.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation) if not base.isNull() else base
+        else:
+            pix = QPixmap(_resource_path('logo.png'))
+        _LOGO_PIXMAPS[size] = pix
+    return pix
+
+
+def _logo_icon() -> QIcon:
+    global _LOGO_ICON
+    if _LOGO_ICON is None:
+        _LOGO_ICON = QIcon(_logo_pixmap())
+    return _LOGO_ICON
+
+
+def _render_figure(build) -> QImage:
+    """Rasteriza la figura de `build()` con Agg; no toca QPixmap, apto para hilos."""
+    canvas = FigureCanvasAgg(build())
+    canvas.draw()
+    buf = canvas.buffer_rgba()
+    h, w = buf.shape[:2]
+    return QImage(buf, w, h, QImage.Format_RGBA8888).copy()
+
+
+class _FigureSignals(QObject):
+    done = Signal(object)
+
+
+class _FigureJob(QRunnable):
+    def __init__(self, build, signals: _FigureSignals):
+        super().__init__()
+        self._build = build; self._signals = signals
+
+    def run(self):
+        try:
+            img = _render_figure(self._build)
+        except Exception:
+            img = None
+        self._signals.done.emit(img)
+
+
+def _set_figure_pixmap(label: QLabel, key: str, build):
+    """Muestra en `label` la figura estática de `build()` como QPixmap cacheado.
+
+    Un QPixmap se pinta con un blit en lugar de redibujar matplotlib en cada
+    resize/expose. Si no está en QPixmapCache se rasteriza en un QThreadPool y
+    el pixmap se coloca cuando llega la imagen (la señal vuelve al hilo de la UI).
+    """
+    # Una etiqueta reutilizada solo acepta la imagen de su última clave
+    label._figure_key = key
+    pix = QPixmapCache.find(key)
+    if pix is not None and not pix.isNull():
+        label.setPixmap(pix)
+        return
+    label.setText('Generando gráfica…')
+    signals = _FigureSignals()
+
+    def _on_done(img):
+        pix = QPixmap.fromImage(img) if img is not None else QPixmap()
+        if not pix.isNull():
+            QPixmapCache.insert(key, pix)
+        try:
+            if getattr(label, '_figure_key', key) != key:
+                return
+            label._figure_signals = None
+            if pix.isNull():
+                label.setText('')
+            else:
+                label.setPixmap(pix)
+        except RuntimeError:
+            pass  # el diálogo se cerró antes de terminar el render
+
+    signals.done.connect(_on_done)
+    # La etiqueta conserva el emisor vivo hasta que termine el trabajo
+    label._figure_signals = signals
+    QThreadPool.globalInstance().start(_FigureJob(build, signals))
+
 
 class TitleBar(QWidget):
     """Barra de título personalizada para la ventana principal."""
@@ -100,9 +482,7 @@ class TitleBar(QWidget):
         # Icono de la app
         icon_label = QLabel()
         try:
-            icon = QIcon(_resource_path('logo.png'))
-            pix = icon.pixmap(20, 20)
-            icon_label.setPixmap(pix)
+            icon_label.setPixmap(_logo_icon().pixmap(20, 20))
         except Exception:
             icon_label.setText('🔢')
         icon_label.setFixedSize(20, 20)
@@ -121,19 +501,13 @@ class TitleBar(QWidget):
             btn.setFlat(True)
             btn.setCursor(Qt.PointingHandCursor)
             btn.setToolTip(tooltip)
-            btn.setStyleSheet(
-                "QPushButton{background:transparent; color:#c3c8d4; border:none;}"
-                "QPushButton:hover{background-color:rgba(255,255,255,0.08);}"
-            )
+            btn.setStyleSheet(_TITLEBAR_BTN_QSS)
             return btn
 
         btn_min = make_btn('−', 'Minimizar')
         btn_max = make_btn('□', 'Maximizar / Restaurar')
         btn_close = make_btn('✕', 'Cerrar')
-        btn_close.setStyleSheet(
-            "QPushButton{background:transparent; color:#c3c8d4; border:none;}"
-            "QPushButton:hover{background-color:#ff4b4b; color:#ffffff;}"
-        )
+        btn_close.setStyleSheet(_TITLEBAR_CLOSE_QSS)
 
         layout.addWidget(btn_min)
         layout.addWidget(btn_max)
@@ -143,9 +517,7 @@ class TitleBar(QWidget):
         btn_max.clicked.connect(self._on_maximize_restore)
         btn_close.clicked.connect(self._on_close)
 
-        self.setStyleSheet(
-            "#titleBar{background-color:#1e1e2e; border-bottom:1px solid #333333;}"
-        )
+        self.setStyleSheet(_TITLEBAR_QSS)
 
     def _on_minimize(self):
         self._window.showMinimized()
@@ -175,6 +547,49 @@ class TitleBar(QWidget):
             super().mouseMoveEvent(event)
 
 
+# Fondo de bienvenida: se decodifica una vez y se pinta en paintEvent en lugar
+# de incrustar la ruta en el QSS (background-image se re-resuelve en cada polish)
+_WELCOME_BG: QPixmap | None = None
+
+_WELCOME_FALLBACK_QSS = (
+    "#welcomeFrame {"
+    "  border-radius: 20px;"
+    "  background: qlineargradient(x1:0, y1:0, x2:1, y2:1,"
+    "    stop:0 #1e1e2e, stop:1 #0f0f1a);"
+    "}"
+)
+
+
+def _welcome_bg_pixmap() -> QPixmap:
+    global _WELCOME_BG
+    if _WELCOME_BG is None:
+        _WELCOME_BG = QPixmap(_resource_path(os.path.join('assets', 'welcome_bg.png')))
+    return _WELCOME_BG
+
+
+class _WelcomeFrame(QFrame):
+    """Marco redondeado con el fondo centrado (mismo aspecto que el antiguo QSS)."""
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setObjectName('welcomeFrame')
+        self._bg = _welcome_bg_pixmap()
+        if self._bg.isNull():
+            # Fallback si no existe la imagen
+            self.setStyleSheet(_WELCOME_FALLBACK_QSS)
+
+    def paintEvent(self, event):  # type: ignore[override]
+        if not self._bg.isNull():
+            p = QPainter(self)
+            p.setRenderHint(QPainter.Antialiasing)
+            path = QPainterPath(); path.addRoundedRect(self.rect(), 20, 20)
+            p.setClipPath(path)
+            p.drawPixmap((self.width() - self._bg.width()) // 2,
+                         (self.height() - self._bg.height()) // 2, self._bg)
+            p.end()
+        super().paintEvent(event)
+
+
 class WelcomeScreen(QMainWindow):
     """Pantalla de bienvenida a pantalla casi completa antes de abrir MatrixQtApp."""
 
@@ -186,7 +601,7 @@ class WelcomeScreen(QMainWindow):
 
         self.setObjectName('welcomeWindow')
         try:
-            self.setWindowIcon(QIcon(_resource_path('logo.png')))
+            self.setWindowIcon(_logo_icon())
         except Exception:
             pass
 
@@ -194,9 +609,7 @@ class WelcomeScreen(QMainWindow):
         outer = QWidget(self)
         self.setCentralWidget(outer)
 
-        frame = QFrame()
-        frame.setObjectName('welcomeFrame')
-        frame.setStyleSheet(self._build_stylesheet())
+        frame = _WelcomeFrame()
 
         layout = QVBoxLayout(outer)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -340,27 +753,6 @@ class WelcomeScreen(QMainWindow):
         scr = QApplication.primaryScreen().geometry()
         self.move(int(scr.center().x() - self.width()/2), int(scr.center().y() - self.height()/2))
 
-    def _build_stylesheet(self) -> str:
-        bg_path = _resource_path(os.path.join('assets', 'welcome_bg.png'))
-        if os.path.exists(bg_path):
-            # Fondo con imagen PNG
-            return (
-                "#welcomeFrame {"
-                "  border-radius: 20px;"
-                f"  background-image: url('{bg_path.replace(chr(92), '/')}');"
-                "  background-position: center;"
-                "  background-repeat: no-repeat;"
-                "}"
-            )
-        # Fallback si no existe la imagen
-        return (
-            "#welcomeFrame {"
-            "  border-radius: 20px;"
-            "  background: qlineargradient(x1:0, y1:0, x2:1, y2:1,"
-            "    stop:0 #1e1e2e, stop:1 #0f0f1a);"
-            "}"
-        )
-
     def _on_enter_clicked(self):
         # Placeholder: la lógica real de transición se implementa en run()
         self.close()
@@ -381,34 +773,7 @@ class SettingsDialog(QDialog):
         root.setContentsMargins(16, 16, 16, 16)
         root.setSpacing(12)
 
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e2e;
-                color: #f5f5ff;
-            }
-            QGroupBox {
-                border: 1px solid #333;
-                border-radius: 8px;
-                margin-top: 10px;
-                font-weight: 600;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px;
-                color: #a78bfa;
-            }
-            QPushButton {
-                background-color: #7f5af0;
-                color:white;
-                border-radius: 6px;
-                padding: 6px 14px;
-                border:none;
-            }
-            QPushButton:hover {
-                background-color: #9b6bff;
-            }
-        """)
+        self.setStyleSheet(_SETTINGS_QSS)
 
         # --- Contenido principal ---
         # Grupo Tema
@@ -452,15 +817,7 @@ class SettingsDialog(QDialog):
         # Overlay "Próximamente" para indicar que la configuración aún no está activa
         overlay = QLabel(self.tr("Próximamente"), self)
         overlay.setAlignment(Qt.AlignCenter)
-        overlay.setStyleSheet(
-            "QLabel{"
-            "  background-color: rgba(0, 0, 0, 180);"
-            "  color: #ffffff;"
-            "  font-size: 18px;"
-            "  font-weight: 700;"
-            "  border-radius: 10px;"
-            "}"
-        )
+        overlay.setStyleSheet(_SETTINGS_OVERLAY_QSS)
         overlay.setAttribute(Qt.WA_TransparentForMouseEvents, False)
         overlay.resize(self.size())
         overlay.move(0, 0)
@@ -498,23 +855,9 @@ class ResultCard(QFrame):
         self.setObjectName("resultCard")
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Maximum)
 
-        # Estilo base por código (además del QSS existente)
-        self.setStyleSheet("""
-            QFrame#resultCard {
-                background-color: #252535;
-                border: 1px solid #333333;
-                border-radius: 12px;
-            }
-        """)
-
-        try:
-            shadow = QGraphicsDropShadowEffect(self)
-            shadow.setBlurRadius(18)
-            shadow.setOffset(0, 6)
-            shadow.setColor(QColor(0, 0, 0, 130))
-            self.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+        # El estilo de la tarjeta y sus hijos vive en el QSS de la ventana
+        # principal (apply_theme): no se re-parsea una hoja por tarjeta.
+        # La sombra la pone MatrixQtApp solo en la tarjeta superior.
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(14, 12, 14, 10)
@@ -526,54 +869,46 @@ class ResultCard(QFrame):
         header.setSpacing(6)
 
         icon_label = QLabel("📊")
-        icon_label.setStyleSheet("font-size: 15px;")
+        icon_label.setObjectName("cardIcon")
         header.addWidget(icon_label)
 
         title_label = QLabel(f"<b>{title}</b>")
-        title_label.setStyleSheet("color: #ffffff; font-size: 13px;")
+        title_label.setObjectName("cardTitleText")
         header.addWidget(title_label)
+        self._title_label = title_label
 
         header.addStretch(1)
 
         close_btn = QToolButton()
         close_btn.setText("✕")
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QToolButton {
-                background: transparent;
-                color: #888;
-                font-size: 12px;
-                padding: 0 4px;
-                border: none;
-            }
-            QToolButton:hover {
-                color: #ffffff;
-            }
-        """)
+        close_btn.setObjectName("cardClose")
         close_btn.clicked.connect(self._on_close)
         header.addWidget(close_btn)
 
         layout.addLayout(header)
 
         # Cuerpo: contenido arbitrario o matriz/descripcion
+        self._table = None; self._table_model = None; self._desc_label = None
         if self._content_widget is not None:
             layout.addWidget(self._content_widget)
         else:
-            if matrix is not None:
-                tbl = QTableWidget()
-                set_table_preview(tbl, np.array(matrix, dtype=float))
-                tbl.setAlternatingRowColors(True)
-                tbl.setStyleSheet(
-                    f"QTableWidget{{gridline-color:#444;}} "
-                    f"QTableWidget::item{{padding:4px; font-family: {MATH_FONT_STACK};}}"
-                )
-                layout.addWidget(tbl)
-
-            if description:
-                lbl = QLabel(description)
-                lbl.setWordWrap(True)
-                lbl.setStyleSheet(f"font-family: {MATH_FONT_STACK}; font-size: 12px; color: #d0d4e4;")
-                layout.addWidget(lbl)
+            # En modo clásico tabla y etiqueta se crean siempre (ocultas si no
+            # hacen falta) para que la tarjeta pueda reutilizarse con reset().
+            tbl = QTableView()
+            self._table_model = NumpyMatrixModel(alignment=Qt.AlignRight | Qt.AlignVCenter, parent=tbl)
+            tbl.setModel(self._table_model)
+            tbl.setAlternatingRowColors(True)
+            tbl.setObjectName("cardTable")
+            layout.addWidget(tbl)
+            self._table = tbl
+
+            lbl = QLabel()
+            lbl.setWordWrap(True)
+            lbl.setObjectName("cardDesc")
+            layout.addWidget(lbl)
+            self._desc_label = lbl
+            self._fill_body(matrix, self._description)
 
         # Footer con acciones
         footer = QHBoxLayout()
@@ -581,48 +916,21 @@ class ResultCard(QFrame):
         footer.setSpacing(6)
 
         btn_copy = QToolButton()
-        btn_copy.setText("📋 Copiar")
+        btn_copy.setIcon(_emoji_icon('📋')); btn_copy.setText("Copiar")
+        btn_copy.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
         btn_copy.setCursor(Qt.PointingHandCursor)
-        btn_copy.setStyleSheet("""
-            QToolButton {
-                background: transparent;
-                color: #a78bfa;
-                border: none;
-                font-size: 11px;
-                padding: 2px 6px;
-            }
-            QToolButton:hover {
-                background-color: rgba(127, 90, 240, 0.12);
-                color: #ffffff;
-            }
-        """)
+        btn_copy.setObjectName("cardAction")
         btn_copy.clicked.connect(self._on_copy)
         footer.addWidget(btn_copy)
 
         btn_steps = QToolButton()
-        btn_steps.setText("🔍 Ver detalles")
+        btn_steps.setIcon(_emoji_icon('🔍')); btn_steps.setText("Ver detalles")
+        btn_steps.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
         btn_steps.setCursor(Qt.PointingHandCursor)
         btn_steps.setEnabled(self._steps is not None or self._details_callback is not None)
-        btn_steps.setStyleSheet("""
-            QToolButton {
-                background: transparent;
-                color: #a78bfa;
-                border: none;
-                font-size: 11px;
-                padding: 2px 6px;
-            }
-            QToolButton:disabled {
-                color: #555a70;
-            }
-            QToolButton:hover:!disabled {
-                background-color: rgba(127, 90, 240, 0.12);
-                color: #ffffff;
-            }
-        """)
-        if self._details_callback is not None:
-            btn_steps.clicked.connect(self._details_callback)
-        elif self._steps is not None:
-            btn_steps.clicked.connect(self._on_steps)
+        self._btn_steps = btn_steps
+        btn_steps.setObjectName("cardAction")
+        btn_steps.clicked.connect(self._on_details)
         footer.addWidget(btn_steps)
 
         footer.addStretch(1)
@@ -630,19 +938,57 @@ class ResultCard(QFrame):
 
         self._run_appear_animation()
 
+    @property
+    def reusable(self) -> bool:
+        """Solo las tarjetas clásicas (matriz + descripción) se pueden reciclar."""
+        return self._content_widget is None
+
+    def _fill_body(self, matrix, description: str):
+        if matrix is not None:
+            self._table_model.set_state(matrix, decimals=2)
+        self._table.setVisible(matrix is not None)
+        self._desc_label.setText(description)
+        self._desc_label.setVisible(bool(description))
+
+    def reset(self, title: str, matrix=None, description: str = "", steps=None):
+        """Reutiliza la tarjeta con otro resultado sin recrear sus widgets."""
+        self._matrix = matrix
+        self._description = description or ""
+        self._steps = steps
+        self._title_label.setText(f"<b>{title}</b>")
+        self._fill_body(matrix, self._description)
+        self._btn_steps.setEnabled(steps is not None)
+        self._run_appear_animation()
+
+    def fit_table(self):
+        """Ajusta columnas una vez insertada (el QSS heredado ya está aplicado)."""
+        if self._table is not None and self._matrix is not None:
+            self.ensurePolished()
+            self._table.resizeColumnsToContents()
+
     # Slots
     def _on_close(self):
         self._run_disappear_animation()
 
+    def _on_details(self):
+        if self._details_callback is not None:
+            self._details_callback()
+        else:
+            self._on_steps()
+
     def _on_copy(self):
         if self._copy_text is not None:
             text = self._copy_text
         else:
-            text = self._description if self._matrix is None else fmt_matrix(np.array(self._matrix, dtype=float), 2)
+            text = self._description if self._matrix is None else fmt_matrix(step_array(self._matrix), 2)
         self._main.copy_to_clipboard(text)
 
     def _on_steps(self):
         if self._steps is not None:
+            # Los pasos pueden llegar como callable: la bitácora simbólica se
+            # genera solo cuando el usuario pide ver los detalles.
+            if callable(self._steps):
+                self._steps = self._steps()
             StepsDialog(self._steps, self._main).exec()
 
     def _run_appear_animation(self):
@@ -666,32 +1012,44 @@ class ResultCard(QFrame):
             anim.setEndValue(0.0)
             anim.setEasingCurve(QEasingCurve.InCubic)
 
-            def _on_finished():
-                self.setParent(None)
-
-            anim.finished.connect(_on_finished)
+            anim.finished.connect(lambda: self._main.release_card(self))
             self._anim_out = anim
             anim.start(QPropertyAnimation.DeleteWhenStopped)
         except Exception:
             # fallback sin animación
-            self.setParent(None)
+            self._main.release_card(self)
 
 
 class TrimDoubleSpinBox(QDoubleSpinBox):
     """QDoubleSpinBox que evita notación científica y ceros de relleno al mostrar."""
+    # Formato y último texto cacheados: textFromValue se llama en cada
+    # repintado/sizeHint, casi siempre con el mismo valor (2 = decimales por defecto)
+    _fmt = "{:.2f}"
+    _last = (None, '')
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setLocale(QLocale.c())  # fuerza separador decimal '.'
+        self._fmt = f"{{:.{self.decimals()}f}}"
+        self._last = (None, '')
+
+    def setDecimals(self, prec: int):  # type: ignore[override]
+        super().setDecimals(prec)
+        self._fmt = f"{{:.{self.decimals()}f}}"
+        self._last = (None, '')
 
     def textFromValue(self, value: float) -> str:  # type: ignore[override]
         # Representación con número de decimales configurado y sin ceros innecesarios
+        if value == self._last[0]:
+            return self._last[1]
         try:
-            s = f"{value:.{self.decimals()}f}"
+            s = self._fmt.format(value)
             if '.' in s:
                 s = s.rstrip('0').rstrip('.')
             # Si es -0, mostrar 0
             if s in ('-0', '-0.0'):
                 s = '0'
+            self._last = (value, s)
             return s
         except Exception:
             return super().textFromValue(value)
@@ -705,26 +1063,97 @@ class TrimDoubleSpinBox(QDoubleSpinBox):
         return super().valueFromText(text.replace(',', '.'))
 
 
+def _first_sign_change(ys: np.ndarray):
+    """Primer índice i con f(x_i) = 0 o cambio de signo en [x_i, x_i+1] (ambos finitos).
+
+    Devuelve (i, es_cero) o None; sustituye el recorrido punto a punto en Python.
+    """
+    y0, y1 = ys[:-1], ys[1:]
+    ok = np.isfinite(y0) & np.isfinite(y1)
+    zero = ok & (y0 == 0)
+    hits = np.flatnonzero(zero | (ok & (y0 * y1 < 0)))
+    if not hits.size:
+        return None
+    i = int(hits[0])
+    return i, bool(zero[i])
+
+
+def _round_owned(C: np.ndarray, decimals: int = 2) -> np.ndarray:
+    """Redondea en sitio un resultado recién calculado (propio) y lo devuelve.
+
+    Evita la copia de np.round en la ruta de resultados; los enteros no se tocan.
+    """
+    if np.issubdtype(C.dtype, np.floating):
+        np.around(C, decimals, out=C)
+    return C
+
+
+def _spin_is_empty(spin) -> bool:
+    """Un spinbox sin specialValueText que sigue en su mínimo se considera vacío."""
+    return spin.value() == spin.minimum() and spin.specialValueText() == ''
+
+
 class MatrixTable(QTableWidget):
-    """Tabla simple para edición de matrices con utilidades de tamaño, aleatorio y extracción."""
+    """Tabla simple para edición de matrices con utilidades de tamaño, aleatorio y extracción.
+
+    Mantiene un búfer numpy sincronizado con las celdas (vía itemChanged), así
+    get_matrix no recorre los items de Qt.
+    """
     def __init__(self, rows: int, cols: int, parent=None):
         super().__init__(rows, cols, parent)
+        self._arr = np.zeros((rows, cols), dtype=float)
         self.setAlternatingRowColors(True)
         self.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setSelectionBehavior(QAbstractItemView.SelectItems)
         self._ensure_items()
+        self.itemChanged.connect(self._on_item_changed)
+
+    @staticmethod
+    def _parse_cell(txt: str) -> float:
+        try:
+            return float(txt.strip().replace(',', '.'))
+        except Exception:
+            return 0.0
+
+    def _on_item_changed(self, item: QTableWidgetItem):
+        i, j = item.row(), item.column()
+        if 0 <= i < self._arr.shape[0] and 0 <= j < self._arr.shape[1]:
+            self._arr[i, j] = self._parse_cell(item.text())
+
+    def _sync_shape(self):
+        r, c = self.rowCount(), self.columnCount()
+        if self._arr.shape != (r, c):
+            arr = np.zeros((r, c), dtype=float)
+            rr, cc = min(r, self._arr.shape[0]), min(c, self._arr.shape[1])
+            arr[:rr, :cc] = self._arr[:rr, :cc]
+            self._arr = arr
 
     def _ensure_items(self):
-        for i in range(self.rowCount()):
-            for j in range(self.columnCount()):
-                if not self.item(i, j):
-                    self.setItem(i, j, QTableWidgetItem('0'))
+        prev = self.blockSignals(True)
+        # Métodos ligados una vez: el doble bucle es la única pasada por celda que queda
+        item, set_item = self.item, self.setItem
+        cols = range(self.columnCount())
+        try:
+            for i in range(self.rowCount()):
+                for j in cols:
+                    if item(i, j) is None:
+                        set_item(i, j, QTableWidgetItem('0'))
+        finally:
+            self.blockSignals(prev)
+        self._sync_shape()
 
     def set_size(self, rows: int, cols: int):
-        self.setRowCount(rows)
-        self.setColumnCount(cols)
-        self._ensure_items()
+        if (rows, cols) == (self.rowCount(), self.columnCount()):
+            return
+        # Un solo repintado y sin señales por cada celda nueva
+        self.setUpdatesEnabled(False); prev = self.blockSignals(True)
+        try:
+            self.setRowCount(rows)
+            self.setColumnCount(cols)
+            self._ensure_items()
+        finally:
+            self.blockSignals(prev); self.setUpdatesEnabled(True)
         self.resizeColumnsToContents()
 
     def set_headers(self, row_headers=None, col_headers=None):
@@ -737,87 +1166,276 @@ class MatrixTable(QTableWidget):
         self._ensure_items()
 
     def get_matrix(self) -> np.ndarray:
-        r, c = self.rowCount(), self.columnCount()
-        arr = np.zeros((r, c), dtype=float)
-        for i in range(r):
-            for j in range(c):
-                it = self.item(i, j)
-                txt = it.text().strip() if it else '0'
-                try:
-                    arr[i, j] = float(txt.replace(',', '.'))
-                except Exception:
-                    arr[i, j] = 0.0
-        return arr
+        """Copia del búfer float64 ya sincronizado: no recorre ni parsea las celdas."""
+        return self._arr.copy()
 
     def fill_random(self, low: int = -5, high: int = 6):
         r, c = self.rowCount(), self.columnCount()
-        vals = np.random.randint(low, high, size=(r, c))
+        vals = _RNG.integers(low, high, size=(r, c))
         # Evitar que toda la matriz sea cero
-        if not np.any(vals):
+        if vals.size and not vals.any():
             vals[0, 0] = 1
-        for i in range(r):
-            for j in range(c):
-                self.setItem(i, j, QTableWidgetItem(str(int(vals[i, j]))))
+        self._set_int_matrix(vals)
+
+    def _set_int_matrix(self, M: np.ndarray):
+        """Vuelca una matriz entera ya del tamaño de la tabla (sin pasar por float/parseo)."""
+        strs = np.char.mod('%d', M).tolist()
+        model = self.model()
+        item_at, set_item = self.item, self.setItem
+        # Sin dataChanged por celda: se emite uno solo sobre todo el rectángulo
+        self.setUpdatesEnabled(False); self.blockSignals(True); model.blockSignals(True)
+        try:
+            for i, row in enumerate(strs):
+                for j, text in enumerate(row):
+                    item = item_at(i, j)
+                    if item is None:
+                        set_item(i, j, QTableWidgetItem(text))
+                    else:
+                        item.setText(text)
+        finally:
+            model.blockSignals(False); self.blockSignals(False); self.setUpdatesEnabled(True)
+        if M.size:
+            model.dataChanged.emit(model.index(0, 0), model.index(M.shape[0] - 1, M.shape[1] - 1))
+        # Con las señales bloqueadas el búfer se escribe directamente
+        self._arr = M.astype(float)
         self.resizeColumnsToContents()
+        self.viewport().update()
+
+
+def _cell_strings(arr: np.ndarray, decimals: int = 2) -> list:
+    """Textos de celda vectorizados: enteros sin decimales, el resto con `decimals`."""
+    arr = np.asarray(arr, dtype=float)
+    with np.errstate(invalid='ignore'):
+        is_int = np.isfinite(arr) & (arr == np.trunc(arr))
+    # "+ 0.0" normaliza -0.0 para que se muestre "0" como str(int(v))
+    if is_int.all():
+        return np.char.mod("%.0f", arr + 0.0).tolist()  # caso típico: matrices enteras
+    txt = np.char.mod(f"%.{decimals}f", arr)
+    if not is_int.any():
+        return txt.tolist()
+    ints = np.char.mod("%.0f", arr + 0.0)
+    return np.where(is_int, ints, txt).tolist()
+
+class IterationTableModel(QAbstractTableModel):
+    """Modelo de solo lectura para las tablas de iteraciones (QTableView).
+
+    Guarda las filas tal cual y formatea cada celda al pedirla la vista (floats
+    con signo explícito +/-); no se crea ningún QTableWidgetItem.
+    """
+    _LAST_BG = QBrush(QColor(0, 80, 120, 160))
+    _LAST_FG = QBrush(QColor('#ffffff'))
 
-
-def set_table_preview(tbl: QTableWidget, arr: np.ndarray, decimals: int = 2):
-    """Pinta en una QTableWidget la matriz arr solo para vista previa."""
-    arr = np.array(arr, dtype=float)
-    r, c = arr.shape
-    tbl.setRowCount(r)
-    tbl.setColumnCount(c)
-    for i in range(r):
-        for j in range(c):
-            v = float(arr[i, j])
-            if float(v).is_integer():
-                s = str(int(v))
-            else:
-                s = f"{v:.{decimals}f}"
-            it = QTableWidgetItem(s)
-            it.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            tbl.setItem(i, j, it)
+    def __init__(self, headers, rows, decimals: int = 6, highlight_last: bool = False, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = rows
+        self._fmt = f"{{:+.{decimals}f}}"
+        self._highlight_last = highlight_last
+        self._alignment = int(Qt.AlignRight | Qt.AlignVCenter)
+        self._bold = QFont(); self._bold.setBold(True)
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            v = self._rows[index.row()][index.column()]
+            if isinstance(v, (float, np.floating)):
+                return 'nan' if v != v else self._fmt.format(float(v) + 0.0)  # -0.0 -> +0.0
+            return str(v)
+        if role == Qt.TextAlignmentRole:
+            return self._alignment
+        if self._highlight_last and index.row() == len(self._rows) - 1:
+            if role == Qt.BackgroundRole:
+                return self._LAST_BG
+            if role == Qt.ForegroundRole:
+                return self._LAST_FG
+            if role == Qt.FontRole:
+                return self._bold
+        return None
+
+
+def _iteration_view(headers, rows, decimals: int = 6, highlight_last: bool = False) -> QTableView:
+    """QTableView con el estilo de las tablas de iteraciones sobre un IterationTableModel."""
+    tbl = QTableView()
+    # Filas de alto fijo: la vista no mide cada fila al desplazarse ni al hacer reset
+    vh = tbl.verticalHeader()
+    vh.setSectionResizeMode(QHeaderView.Fixed); vh.setDefaultSectionSize(tbl.fontMetrics().height() + 10)
+    tbl.setModel(IterationTableModel(headers, rows, decimals, highlight_last, tbl))
     tbl.resizeColumnsToContents()
+    tbl.setAlternatingRowColors(True)
+    tbl.setObjectName('iterTable')
+    return tbl
+
+
+class NumpyMatrixModel(QAbstractTableModel):
+    """Modelo de solo lectura sobre un np.ndarray para vistas previas (QTableView).
+
+    Los textos se formatean una vez por estado; cambiar de estado es un único
+    reset del modelo en lugar de crear un QTableWidgetItem por celda.
+    """
+    # Códigos de resaltado por celda (precalculados con numpy en set_state)
+    _HL_NONE, _HL_CHANGED, _HL_ROW, _HL_COL = 0, 1, 2, 3
+    _BACKGROUNDS = {
+        1: QBrush(QColor('#0099a8')),
+        2: QBrush(QColor(0, 153, 168, 40)),
+        3: QBrush(QColor(0, 153, 168, 30)),
+    }
+    _CHANGED_FG = QBrush(QColor('white'))
+    _MUTED_FG = QBrush(QColor('#777777'))
+
+    def __init__(self, arr=None, decimals: int = 2, trim_integers: bool = True,
+                 alignment=Qt.AlignCenter, parent=None):
+        super().__init__(parent)
+        self._trim_integers = trim_integers
+        self._alignment = int(alignment)
+        self._bold = QFont(); self._bold.setBold(True)
+        self._arr = np.zeros((0, 0)); self._strs = []
+        self._hl = []; self._has_prev = False; self._only_changes = False
+        if arr is not None:
+            self.set_state(arr, decimals=decimals)
+
+    def set_state(self, arr, prev=None, decimals: int = 2, hl_rows=None, hl_cols=None, only_changes: bool = False):
+        self.beginResetModel()
+        self._arr = np.array(arr, dtype=float)
+        if self._trim_integers or decimals == 0:
+            self._strs = _cell_strings(self._arr, decimals)
+        else:
+            self._strs = np.char.mod(f"%.{decimals}f", self._arr).tolist()
+        r, c = self._arr.shape
+        hl = np.zeros((r, c), dtype=np.int8)
+        cols = [j for j in (hl_cols or ()) if 0 <= j < c]
+        rows = [i for i in (hl_rows or ()) if 0 <= i < r]
+        hl[:, cols] = self._HL_COL
+        hl[rows, :] = self._HL_ROW
+        self._has_prev = prev is not None and np.shape(prev) == self._arr.shape
+        if self._has_prev:
+            hl[np.round(self._arr, decimals) != np.round(prev, decimals)] = self._HL_CHANGED
+        self._hl = hl.tolist()
+        self._only_changes = only_changes
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._arr.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else (self._arr.shape[1] if self._arr.ndim == 2 else 0)
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        i, j = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return self._strs[i][j]
+        if role == Qt.TextAlignmentRole:
+            return self._alignment
+        code = self._hl[i][j]
+        if role == Qt.BackgroundRole:
+            return self._BACKGROUNDS.get(code)
+        if role == Qt.ForegroundRole:
+            if code == self._HL_CHANGED:
+                return self._CHANGED_FG
+            if self._has_prev and self._only_changes:
+                return self._MUTED_FG
+            return None
+        if role == Qt.FontRole and code == self._HL_CHANGED:
+            return self._bold
+        return None
+
+# Patrones de las descripciones de pasos (compilados una vez)
+_RE_SWAP = re.compile(r"Intercambiar\s+fila\s+(\d+)\s+con\s+fila\s+(\d+)", re.IGNORECASE)
+_RE_DIV = re.compile(r"Dividir\s+fila\s+(\d+)\s+por\s+([\-\d\./]+)", re.IGNORECASE)
+_RE_ROWOP = re.compile(r"R\s*(\d+)\s*<-\s*R\s*\1\s*([+\-])\s*\(?([\-\d\./]+)\)?\s*\*?\s*R\s*(\d+)")
+
+
+@lru_cache(maxsize=256)
+def _parse_step_description(desc: str):
+    """(filas a resaltar, columnas a resaltar, texto legible) de un paso."""
+    d = desc.strip()
+    m = _RE_SWAP.search(d)
+    if m:
+        i, j = int(m.group(1))-1, int(m.group(2))-1
+        return frozenset({i, j}), frozenset(), f"Operación por filas: R{m.group(1)} ↔ R{m.group(2)}"
+    m = _RE_DIV.search(d)
+    if m:
+        x = m.group(2)
+        return frozenset({int(m.group(1))-1}), frozenset(), f"Escalado: R{m.group(1)} ← R{m.group(1)}/{x}"
+    m = _RE_ROWOP.search(d)
+    if m:
+        k, sign, coef, j = m.groups(); op = '+' if sign == '+' else '−'
+        return frozenset({int(k)-1, int(j)-1}), frozenset(), f"Operación elemental: R{k} ← R{k} {op} ({coef})·R{j}"
+    return frozenset(), frozenset(), (d if d.lower().startswith('calcular') else desc)
+
 
 class StepsDialog(QDialog):
     def __init__(self, steps, parent=None):
         super().__init__(parent)
+        self.setObjectName('stepsDialog')
         self.setWindowTitle('Paso a paso')
         self.resize(940, 620)
         self.steps = steps
+        # Descripciones/parseo una sola vez; las matrices se convierten a ndarray
+        # la primera vez que se visitan y quedan en caché para la navegación.
+        self._descs = [d for d, _ in steps]
+        self._parsed = [_parse_step_description(d) for d in self._descs]
+        self._mats: list[np.ndarray | None] = [None] * len(steps)
 
         root = QHBoxLayout(self)
         left = QVBoxLayout(); right = QVBoxLayout()
         root.addLayout(left, 1); root.addLayout(right, 2)
 
         self.listbox = QListWidget(); left.addWidget(self.listbox)
-        for i, (desc, _) in enumerate(steps):
-            QListWidgetItem(f"{i+1}. {desc}", self.listbox)
+        self.listbox.setUniformItemSizes(True)
+        self.listbox.setUpdatesEnabled(False)
+        self.listbox.addItems([f"{i+1}. {desc}" for i, desc in enumerate(self._descs)])
+        self.listbox.setUpdatesEnabled(True)
 
         header = QHBoxLayout(); right.addLayout(header)
-        self.step_title = QLabel(''); self.step_title.setStyleSheet('font-weight:600; font-size:14px;')
+        self.step_title = QLabel(''); self.step_title.setObjectName('stepTitle')
         header.addWidget(self.step_title, 1)
         header.addWidget(QLabel('Decimales:'))
         self.decimals = QSpinBox(); self.decimals.setRange(0,8); self.decimals.setValue(2); header.addWidget(self.decimals)
         self.only_changes = QCheckBox('Solo cambios'); header.addWidget(self.only_changes)
         self.manual_mode = QCheckBox('Modo manual'); header.addWidget(self.manual_mode)
-        self.copy_btn = QPushButton('📋 Copiar matriz'); header.addWidget(self.copy_btn)
+        self.copy_btn = QPushButton(_emoji_icon('📋'), 'Copiar matriz'); header.addWidget(self.copy_btn)
 
-        self.preview = QTableWidget(); self.preview.setAlternatingRowColors(True)
+        self._model = NumpyMatrixModel(trim_integers=False, parent=self)
+        self.preview = QTableView(); self.preview.setModel(self._model); self.preview.setAlternatingRowColors(True)
         self.preview.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.preview.setSelectionMode(QAbstractItemView.NoSelection)
         self.preview.setFocusPolicy(Qt.NoFocus)
-        self.preview.setStyleSheet('QTableWidget::item:selected{background:transparent; color:inherit;}')
         right.addWidget(self.preview, 1)
 
         self.explain = QLabel(''); self.explain.setWordWrap(True)
-        self.explain.setStyleSheet(f"font-family:{MATH_FONT_STACK}; color:#cfd8dc;")
+        self.explain.setObjectName('stepExplain')
         right.addWidget(self.explain)
 
-        self.stats = QLabel(''); self.stats.setStyleSheet('color:#888;'); right.addWidget(self.stats)
+        self.stats = QLabel(''); self.stats.setObjectName('stepStats'); right.addWidget(self.stats)
 
         nav = QHBoxLayout(); right.addLayout(nav)
-        self.prev_btn = QPushButton('◀ Anterior'); self.next_btn = QPushButton('Siguiente ▶')
+        self.prev_btn = QPushButton(_emoji_icon('◀'), 'Anterior'); self.next_btn = QPushButton(_emoji_icon('▶'), 'Siguiente')
+        self.next_btn.setLayoutDirection(Qt.RightToLeft)
         nav.addWidget(self.prev_btn); nav.addWidget(self.next_btn); nav.addStretch(1)
 
         QShortcut(QKeySequence(Qt.Key_Left), self, activated=lambda: self._move(-1))
@@ -833,21 +1451,27 @@ class StepsDialog(QDialog):
 
         if steps:
             self.listbox.setCurrentRow(0)
-        self.setStyleSheet('QListWidget::item{padding:6px;} QTableWidget{gridline-color:#444;}')
 
     def _move(self, delta: int):
         i = max(0, min(self.listbox.count()-1, self.listbox.currentRow()+delta))
+        # currentRowChanged ya dispara _on_select; no repintar dos veces
         self.listbox.setCurrentRow(i)
-        if 0 <= i < self.listbox.count():
-            self.step_title.setText(self.listbox.item(i).text())
-        self._on_select(i)
+
+    def _mat(self, row: int) -> np.ndarray:
+        arr = self._mats[row]
+        if arr is None:
+            arr = step_array(self.steps[row][1])
+            self._mats[row] = arr
+        return arr
 
     def _on_select(self, row: int):
         if row < 0 or row >= len(self.steps): return
-        desc, mat = self.steps[row]; self.step_title.setText(desc)
-        arr = np.array(mat.tolist(), dtype=float)
-        prev = np.array(self.steps[row-1][1].tolist(), dtype=float) if row>0 else None
-        hl_rows, hl_cols, pretty = self._parse_step_description(desc)
+        desc = self._descs[row]; self.step_title.setText(desc)
+        arr = self._mat(row)
+        prev = self._mat(row-1) if row>0 else None
+        if prev is not None and prev.shape != arr.shape:
+            prev = None
+        hl_rows, hl_cols, pretty = self._parsed[row]
         self._render_matrix(arr, prev, hl_rows=hl_rows, hl_cols=hl_cols)
         self.explain.setText(pretty if self.manual_mode.isChecked() else '')
         d = self.decimals.value(); changed = 0
@@ -856,48 +1480,16 @@ class StepsDialog(QDialog):
         self.stats.setText(f"Tamaño: {arr.shape[0]} × {arr.shape[1]}  •  Celdas cambiadas: {changed}")
 
     def _render_matrix(self, arr: np.ndarray, prev: np.ndarray | None, hl_rows: set[int] | None = None, hl_cols: set[int] | None = None):
-        d = self.decimals.value(); r,c = arr.shape
-        self.preview.setRowCount(r); self.preview.setColumnCount(c)
-        for i in range(r):
-            for j in range(c):
-                v = float(arr[i,j]); s = f"{v:.{d}f}" if (not float(v).is_integer() or d>0) else str(int(v))
-                item = QTableWidgetItem(s); item.setFlags(Qt.ItemIsEnabled); item.setTextAlignment(Qt.AlignCenter)
-                if prev is not None:
-                    pv = float(prev[i,j])
-                    if round(v,d) != round(pv,d):
-                        item.setBackground(QColor('#0099a8')); f = item.font(); f.setBold(True); item.setFont(f); item.setForeground(QColor('white'))
-                    elif self.only_changes.isChecked():
-                        item.setForeground(QColor('#777777'))
-                if hl_rows and i in hl_rows and item.background().color().alpha() == 0:
-                    item.setBackground(QColor(0,153,168,40))
-                if hl_cols and j in hl_cols and item.background().color().alpha() == 0:
-                    item.setBackground(QColor(0,153,168,30))
-                self.preview.setItem(i,j,item)
-        self.preview.clearSelection()
-
-    def _parse_step_description(self, desc: str):
-        import re
-        hl_rows: set[int] = set(); hl_cols: set[int] = set(); pretty = desc; d = desc.strip()
-        m = re.search(r"Intercambiar\s+fila\s+(\d+)\s+con\s+fila\s+(\d+)", d, re.IGNORECASE)
-        if m:
-            i,j = int(m.group(1))-1, int(m.group(2))-1; hl_rows.update({i,j}); pretty = f"Operación por filas: R{m.group(1)} ↔ R{m.group(2)}"; return hl_rows, hl_cols, pretty
-        m = re.search(r"Dividir\s+fila\s+(\d+)\s+por\s+([\-\d\./]+)", d, re.IGNORECASE)
-        if m:
-            i = int(m.group(1))-1; x = m.group(2); hl_rows.add(i); pretty = f"Escalado: R{m.group(1)} ← R{m.group(1)}/{x}"; return hl_rows, hl_cols, pretty
-        m = re.search(r"R\s*(\d+)\s*<-\s*R\s*\1\s*([+\-])\s*\(?([\-\d\./]+)\)?\s*\*?\s*R\s*(\d+)", d)
-        if m:
-            k, sign, coef, j = m.groups(); k_i = int(k)-1; j_i = int(j)-1; hl_rows.update({k_i,j_i}); op = '+' if sign == '+' else '−'; pretty = f"Operación elemental: R{k} ← R{k} {op} ({coef})·R{j}"; return hl_rows, hl_cols, pretty
-        if d.lower().startswith('calcular'):
-            pretty = d
-        return hl_rows, hl_cols, pretty
+        self._model.set_state(arr, prev, self.decimals.value(), hl_rows, hl_cols, self.only_changes.isChecked())
 
     def _copy_current(self):
         row = self.listbox.currentRow()
         if 0 <= row < len(self.steps):
-            _, mat = self.steps[row]; arr = np.array(mat.tolist(), dtype=float)
-            self.parent().copy_to_clipboard(fmt_matrix(arr, self.decimals.value()))
+            self.parent().copy_to_clipboard(fmt_matrix(self._mat(row), self.decimals.value()))
 
 class BisectionResultDialog(QDialog):
+    """Detalles de bisección. El árbol de widgets se crea una vez; set_payload
+    lo rellena de nuevo, así MatrixQtApp puede reciclar el diálogo al cerrarlo."""
     def __init__(self, expr_text: str, xi: float, xu: float, rows, epsilon_text: str | None = None, parent=None):
         super().__init__(parent)
         self.setWindowTitle('Método de Bisección — Detalles')
@@ -907,58 +1499,59 @@ class BisectionResultDialog(QDialog):
         title = QLabel('<b>Método de bisección</b>'); lay.addWidget(title)
         # Encabezado con métricas solicitadas
         header = QWidget(); grid = QGridLayout(header)
+        header.setStyleSheet("QLabel{color:#ddd;}")
         grid.setContentsMargins(0,0,0,0); grid.setHorizontalSpacing(18); grid.setVerticalSpacing(4)
-        grid.addWidget(QLabel(f"f(x) = <span style=\"font-family:{MATH_FONT_STACK}\">{expr_text}</span>"), 0, 0, 1, 4)
+        self._formula = QLabel(); grid.addWidget(self._formula, 0, 0, 1, 4)
+        self._metrics = [QLabel() for _ in range(4)]
+        for c, lab in enumerate(self._metrics):
+            grid.addWidget(lab, 1, c)
+        self._tol = QLabel(); grid.addWidget(self._tol, 2, 0)
+        lay.addWidget(header)
+
+        tbl = _iteration_view(['iteración','xi','xu','xr','Ea','yi','yu','yr'], [], 6); lay.addWidget(tbl)
+        self._table = tbl
+
+        self._plot = QLabel(); self._plot.setAlignment(Qt.AlignCenter); self._plot.setMinimumHeight(350)
+        lay.addWidget(self._plot)
+        self.set_payload(expr_text, xi, xu, rows, epsilon_text)
+
+    def set_payload(self, expr_text: str, xi: float, xu: float, rows, epsilon_text: str | None = None):
+        self._formula.setText(f"f(x) = <span style=\"font-family:{MATH_FONT_STACK}\">{expr_text}</span>")
         if rows:
             n = len(rows)
             xr = float(rows[-1][3])
             ea = float(rows[-1][4])
             residual = abs(float(rows[-1][7]))
             sgn = '+' if xr >= 0 else ''
-            grid.addWidget(QLabel(f"Iteraciones: <b>{n}</b>"), 1, 0)
-            grid.addWidget(QLabel(f"Raíz: <b>{sgn}{xr:.6f}</b>"), 1, 1)
-            grid.addWidget(QLabel(f"Error (Ea): <b>{ea*100:.2f}%</b>"), 1, 2)
-            grid.addWidget(QLabel(f"Error raíz |f(r)|: <b>{residual:.6g}</b>"), 1, 3)
-            if epsilon_text is not None and epsilon_text != '':
-                grid.addWidget(QLabel(f"Tolerancia: <b>{epsilon_text}</b>"), 2, 0)
-        # estilizar header
-        for i in range(grid.count()):
-            w = grid.itemAt(i).widget()
-            if isinstance(w, QLabel):
-                w.setStyleSheet("color:#ddd;")
-        lay.addWidget(header)
+            texts = [f"Iteraciones: <b>{n}</b>", f"Raíz: <b>{sgn}{xr:.6f}</b>",
+                     f"Error (Ea): <b>{ea*100:.2f}%</b>", f"Error raíz |f(r)|: <b>{residual:.6g}</b>"]
+        else:
+            texts = [''] * 4
+        for lab, text in zip(self._metrics, texts):
+            lab.setText(text); lab.setVisible(bool(text))
+        show_tol = bool(rows) and epsilon_text is not None and epsilon_text != ''
+        self._tol.setText(f"Tolerancia: <b>{epsilon_text}</b>" if show_tol else '')
+        self._tol.setVisible(show_tol)
 
-        tbl = QTableWidget(); lay.addWidget(tbl)
-        headers = ['iteración','xi','xu','xr','Ea','yi','yu','yr']
-        tbl.setColumnCount(len(headers)); tbl.setHorizontalHeaderLabels(headers)
-        tbl.setRowCount(len(rows))
-        def fmt(v):
-            return ('+' if v>=0 else '') + f"{v:.6f}"
-        for r, row in enumerate(rows):
-            for c, v in enumerate(row):
-                item = QTableWidgetItem(fmt(v) if isinstance(v, float) or isinstance(v, np.floating) else str(v))
-                item.setTextAlignment(Qt.AlignRight|Qt.AlignVCenter)
-                tbl.setItem(r,c,item)
-        tbl.resizeColumnsToContents()
-        tbl.setAlternatingRowColors(True)
-        tbl.setStyleSheet(f"QTableWidget::item{{font-family:{MATH_FONT_STACK}; padding:4px;}}")
+        self._table.model().set_rows(rows)
+        self._table.resizeColumnsToContents()
+        self._table.scrollToTop()
 
         try:
-            fig = Figure(figsize=(6,3.5), dpi=100)
-            ax = fig.add_subplot(111)
-            x = _SYM_symbols('x'); expr = _SYM_sympify(expr_text); fcall = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
-            xs = np.linspace(xi, xu, 400)
-            ys = fcall(xs)
-            ax.axhline(0, color='#666', lw=1)
-            ax.plot(xs, ys, color='#4fc3f7', label='f(x)')
-            if rows:
-                xr = rows[-1][3]; yr = rows[-1][7]
-                ax.plot([xr],[yr],'o', color='#e05d5d', label='xr')
-            ax.set_xlabel('x'); ax.set_ylabel('f(x)'); ax.grid(True, linestyle='--', alpha=0.3)
-            ax.legend(frameon=False)
-            canvas = FigureCanvasQTAgg(fig)
-            canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            lay.addWidget(canvas)
+            def build():
+                fig = Figure(figsize=(6,3.5), dpi=100)
+                ax = fig.add_subplot(111)
+                xs, ys = _eval_curve(expr_text, float(xi), float(xu))
+                ax.axhline(0, color='#666', lw=1)
+                ax.plot(xs, ys, color='#4fc3f7', label='f(x)')
+                if rows:
+                    xr = rows[-1][3]; yr = rows[-1][7]
+                    ax.plot([xr],[yr],'o', color='#e05d5d', label='xr')
+                ax.set_xlabel('x'); ax.set_ylabel('f(x)'); ax.grid(True, linestyle='--', alpha=0.3)
+                ax.legend(frameon=False)
+                return fig
+            last = (rows[-1][3], rows[-1][7]) if rows else None
+            _set_figure_pixmap(self._plot, f"hk_bisection:{expr_text}:{float(xi)!r}:{float(xu)!r}:{last!r}", build)
         except Exception:
             pass
 
@@ -975,7 +1568,7 @@ class MatrixQtApp(QMainWindow):
             pass
         # Establecer icono de ventana (también lo aplicamos a nivel de QApplication en run())
         try:
-            self.setWindowIcon(QIcon(_resource_path('logo.png')))
+            self.setWindowIcon(_logo_icon())
         except Exception:
             pass
         self.resize(1280, 800)
@@ -1124,14 +1717,19 @@ class MatrixQtApp(QMainWindow):
 
         # state
         self.current_view = None
-        self._result_widgets = []
-        self._dialogs = []
+        # Débil: una tarjeta destruida por Qt desaparece sola del registro
+        self._result_widgets: weakref.WeakSet[QWidget] = weakref.WeakSet()
+        self._card_pool: list[ResultCard] = []
+        self._shadow_card: QWidget | None = None
+        self._error_pool: list[QWidget] = []
+        self._bisect_pool: list[BisectionResultDialog] = []
         self.show_ops()
         # Marcar como activo el botón inicial para que siempre haya uno seleccionado
         self.btn_ops.setChecked(True)
-        # fonts and theme
-        self._init_fonts()
+        # fonts and theme: las fuentes empaquetadas no intervienen en el primer
+        # pintado, así que su registro se difiere al siguiente ciclo del event loop
         self.apply_theme()
+        QTimer.singleShot(0, self._init_fonts)
 
     def _return_to_welcome(self):
         # Volver a la pantalla de bienvenida sin cerrar la aplicación completa
@@ -1153,15 +1751,22 @@ class MatrixQtApp(QMainWindow):
                 'EBGaramond-Math.otf', 'EBGaramondMath.otf', 'STIXTwoMath-Regular.ttf',
                 'latinmodern-math.otf', 'LatinModernMath-Regular.otf'
             ]
+            # Un solo listado del directorio en vez de un stat por candidato
+            present = set(os.listdir(fonts_dir)) if os.path.isdir(fonts_dir) else set()
             for name in candidates:
-                p = os.path.join(fonts_dir, name)
-                if os.path.exists(p):
+                if name in present:
                     try:
-                        QFontDatabase.addApplicationFont(p)
+                        QFontDatabase.addApplicationFont(os.path.join(fonts_dir, name))
                     except Exception:
                         pass
         except Exception:
             pass
+        # Pre-renderizar los glifos de botones repetidos una sola vez
+        try:
+            for glyph in _EMOJI_GLYPHS:
+                _emoji_icon(glyph)
+        except Exception:
+            pass
 
     def apply_theme(self):
         """Aplicar el design system oscuro tipo "dark glass/cyberpunk" (fase 1).
@@ -1240,9 +1845,65 @@ class MatrixQtApp(QMainWindow):
             QFrame#resultCard {{
                 background-color: #252535;
                 border-radius: 12px;
-                border: 1px solid rgba(148,161,178,0.35);
+                border: 1px solid #333333;
                 padding: 12px 14px;
             }}
+            QLabel#cardIcon {{ font-size: 15px; }}
+            QLabel#cardTitleText {{ color: #ffffff; font-size: 13px; }}
+            QLabel#cardDesc {{
+                font-family: {MATH_FONT_STACK};
+                font-size: 12px;
+                color: #d0d4e4;
+            }}
+            QToolButton#cardClose {{
+                background: transparent;
+                color: #888;
+                font-size: 12px;
+                padding: 0 4px;
+                border: none;
+            }}
+            QToolButton#cardClose:hover {{ color: #ffffff; }}
+            QToolButton#cardAction {{
+                background: transparent;
+                color: #a78bfa;
+                border: none;
+                font-size: 11px;
+                padding: 2px 6px;
+            }}
+            QToolButton#cardAction:disabled {{ color: #555a70; }}
+            QToolButton#cardAction:hover:!disabled {{
+                background-color: rgba(127, 90, 240, 0.12);
+                color: #ffffff;
+            }}
+            QTableView#cardTable {{ gridline-color: #444; }}
+            QTableView#cardTable::item, QTableView#iterTable::item {{ padding: 4px; }}
+
+            /* Diálogo paso a paso */
+            QDialog#stepsDialog QListWidget::item {{ padding: 6px; }}
+            QDialog#stepsDialog QTableView {{ gridline-color: #444; }}
+            QDialog#stepsDialog QTableView::item:selected {{ background: transparent; }}
+            QLabel#stepTitle {{ font-weight: 600; font-size: 14px; }}
+            QLabel#stepExplain {{ font-family: {MATH_FONT_STACK}; color: #cfd8dc; }}
+            QLabel#stepStats {{ color: #888; }}
+
+            /* Teclado matemático compacto (_build_math_keyboard) */
+            QWidget#mathKeyboard QToolButton {{
+                background-color: #2a2a3e;
+                border: 1px solid #444;
+                border-radius: 6px;
+                color: #ddd;
+                font-family: 'Consolas', monospace;
+                font-size: 12px;
+                padding: 2px 6px;
+            }}
+            QWidget#mathKeyboard QToolButton:hover {{
+                background-color: #7f5af0;
+                color: white;
+                border-color: #7f5af0;
+            }}
+            QWidget#mathKeyboard QToolButton:pressed {{
+                background-color: #6a4fc9;
+            }}
 
             /* Checkboxes y radio buttons sobre fondo oscuro */
             QCheckBox, QRadioButton {{
@@ -1337,7 +1998,7 @@ class MatrixQtApp(QMainWindow):
             }}
 
             /* Tablas tipo dashboard */
-            QTableWidget {{
+            QTableView {{
                 background-color: #2a2a3e;
                 alternate-background-color: #24243a;
                 gridline-color: #2a2a3e;
@@ -1346,7 +2007,7 @@ class MatrixQtApp(QMainWindow):
                 selection-background-color: {ACCENT_PRIMARY};
                 selection-color: {TEXT_PRIMARY};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 8px 8px;
                 color: {TEXT_PRIMARY};
                 font-family: {MATH_FONT_STACK};
@@ -1459,6 +2120,16 @@ class MatrixQtApp(QMainWindow):
             QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
                 border: 1px solid {ACCENT_PRIMARY};
             }}
+            /* Entradas y rótulos de f(x) en las vistas de raíces (antes una hoja por widget) */
+            QLabel#mathFnLabel {{ font-family: {MATH_FONT_STACK}; font-size: 14px; }}
+            QLineEdit#mathInput {{ font-family: {MATH_FONT_STACK}; font-size: 13px; }}
+            QLabel#derivPreview {{
+                font-family: {MATH_FONT_STACK};
+                background: #15171a;
+                border: 1px solid #2b2d31;
+                border-radius: 8px;
+                padding: 10px;
+            }}
 
             /* Botones de incremento/decremento de SpinBox */
             QSpinBox::up-button, QDoubleSpinBox::up-button {{
@@ -1619,17 +2290,101 @@ class MatrixQtApp(QMainWindow):
     def clear_results(self):
         for i in reversed(range(self.right_layout.count())):
             w = self.right_layout.itemAt(i).widget()
-            if w: w.setParent(None)
+            if isinstance(w, ResultCard):
+                self.release_card(w)
+            elif w is not None and w.objectName() == 'errorCard':
+                self._release_error_card(w)
+            elif w:
+                w.setParent(None)
         self._result_widgets.clear()
 
+    def release_card(self, card: "ResultCard"):
+        """Quita una tarjeta del panel; las clásicas se guardan para reutilizarlas.
+
+        La tarjeta en pool conserva su padre (sin reparentar ni re-pulir estilos al
+        reinsertarla); las demás se destruyen con deleteLater.
+        """
+        card.hide()
+        self.right_layout.removeWidget(card)
+        self._result_widgets.discard(card)
+        if card is self._shadow_card:
+            card.setGraphicsEffect(None)
+            self._shadow_card = None
+        if card in self._card_pool:
+            return
+        if card.reusable and len(self._card_pool) < _CARD_POOL_SIZE:
+            self._card_pool.append(card)
+        else:
+            card.deleteLater()
+
+    def _build_error_card(self) -> QWidget:
+        card = QWidget(); card.setObjectName('errorCard'); lay = QVBoxLayout(card)
+        lay.setContentsMargins(8, 8, 8, 8)
+        title = QLabel('<b>Error</b>'); lay.addWidget(title)
+        card._message = QLabel(); card._message.setWordWrap(True); lay.addWidget(card._message)
+        row = QHBoxLayout(); lay.addLayout(row)
+        btn_delete = QPushButton(_emoji_icon('🗑️'), 'Quitar'); row.addWidget(btn_delete)
+        row.addStretch(1)
+        btn_delete.clicked.connect(self._on_error_card_remove)
+        return card
+
+    def _on_error_card_remove(self):
+        # Slot compartido por todas las tarjetas de error: el botón pertenece a su tarjeta
+        btn = self.sender()
+        if btn is not None and btn.parentWidget() is not None:
+            self._release_error_card(btn.parentWidget())
+
+    def _release_error_card(self, card: QWidget):
+        card.hide()
+        self.right_layout.removeWidget(card)
+        self._result_widgets.discard(card)
+        if card in self._error_pool:
+            return
+        if len(self._error_pool) < _CARD_POOL_SIZE:
+            self._error_pool.append(card)
+        else:
+            card.deleteLater()
+
+    def _shadow_top_card(self, card: QWidget):
+        """Deja la sombra solo en la tarjeta recién insertada arriba.
+
+        Cada QGraphicsDropShadowEffect obliga a renderizar la tarjeta fuera de
+        pantalla y difuminarla en cada repintado; con una sola el coste no crece
+        con el número de resultados.
+        """
+        prev = self._shadow_card
+        if prev is card:
+            return
+        if prev is not None:
+            try:
+                prev.setGraphicsEffect(None)
+            except RuntimeError:
+                pass
+        try:
+            shadow = QGraphicsDropShadowEffect(card)
+            shadow.setBlurRadius(18)
+            shadow.setOffset(0, 6)
+            shadow.setColor(QColor(0, 0, 0, 130))
+            card.setGraphicsEffect(shadow)
+        except Exception:
+            pass
+        self._shadow_card = card
+
     def copy_to_clipboard(self, text: str):
         QApplication.clipboard().setText(text, QClipboard.Clipboard)
 
     def push_result(self, title: str, matrix: np.ndarray | None, description: str = '', steps=None, accent: str | None = None):
         """API clásica para resultados matriciales (usa matriz + descripción)."""
-        card = ResultCard(title, self, matrix=matrix, description=description, steps=steps)
+        if self._card_pool:
+            card = self._card_pool.pop()
+            card.reset(title, matrix=matrix, description=description, steps=steps)
+        else:
+            card = ResultCard(title, self, matrix=matrix, description=description, steps=steps)
         self.right_layout.insertWidget(0, card)
-        self._result_widgets.append(card)
+        self._shadow_top_card(card)
+        card.show()
+        card.fit_table()
+        self._result_widgets.add(card)
         return card
 
     def add_result_card(self, title: str, content_widget: QWidget, steps=None, copy_text: str | None = None, details_callback=None):
@@ -1640,26 +2395,18 @@ class MatrixQtApp(QMainWindow):
         """
         card = ResultCard(title, self, content_widget=content_widget, steps=steps, copy_text=copy_text, details_callback=details_callback)
         self.right_layout.insertWidget(0, card)
-        self._result_widgets.append(card)
+        self._shadow_top_card(card)
+        self._result_widgets.add(card)
         return card
 
     def push_error(self, message: str):
         """Push a compact error card at the TOP of results with only a delete action."""
-        card = QWidget(); card.setObjectName('errorCard'); lay = QVBoxLayout(card)
-        lay.setContentsMargins(8, 8, 8, 8)
-        title = QLabel('<b>Error</b>'); lay.addWidget(title)
-        lbl = QLabel(message); lbl.setWordWrap(True); lay.addWidget(lbl)
-        row = QHBoxLayout(); lay.addLayout(row)
-        btn_delete = QPushButton('🗑️ Quitar'); row.addWidget(btn_delete)
-        row.addStretch(1)
-        def _remove():
-            card.setParent(None)
-            if card in self._result_widgets:
-                self._result_widgets.remove(card)
-        btn_delete.clicked.connect(_remove)
+        card = self._error_pool.pop() if self._error_pool else self._build_error_card()
+        card._message.setText(message)
         # Insert at top
         self.right_layout.insertWidget(0, card)
-        self._result_widgets.append(card)
+        card.show()
+        self._result_widgets.add(card)
         return card
 
     def _build_method_card(self, title: str, subtitle: str | None = None):
@@ -1697,26 +2444,6 @@ class MatrixQtApp(QMainWindow):
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             btn.setToolTip(insert)
             btn.clicked.connect(lambda _=None, payload=insert: self._insert_text(target_edit, payload))
-            # Estilo compacto tipo teclado para funciones matemáticas
-            btn.setStyleSheet("""
-                QToolButton {
-                    background-color: #2a2a3e;
-                    border: 1px solid #444;
-                    border-radius: 6px;
-                    color: #ddd;
-                    font-family: 'Consolas', monospace;
-                    font-size: 12px;
-                    padding: 2px 6px;
-                }
-                QToolButton:hover {
-                    background-color: #7f5af0;
-                    color: white;
-                    border-color: #7f5af0;
-                }
-                QToolButton:pressed {
-                    background-color: #6a4fc9;
-                }
-            """)
             grid.addWidget(btn, row, col)
 
         rows = [
@@ -1752,44 +2479,10 @@ class MatrixQtApp(QMainWindow):
         """Aplica estilos modernos DIRECTAMENTE al botón para asegurar que se vean bien"""
         if tipo == 'primary':
             # Estilo para botón CALCULAR (Violeta sólido)
-            btn.setStyleSheet("""
-            QPushButton {
-                background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1, stop:0 #8b5cf6, stop:1 #7c3aed);
-                color: white;
-                font-weight: bold;
-                border-radius: 8px;
-                padding: 10px 20px;
-                border: none;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #9370db;
-            }
-            QPushButton:pressed {
-                background-color: #6a4fc9;
-                padding-top: 12px; /* Efecto de hundirse */
-            }
-        """)
+            btn.setStyleSheet(_BTN_PRIMARY_QSS)
         else:
             # Estilo para botones SECUNDARIOS (Outline violeta)
-            btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #a78bfa;
-                font-weight: 600;
-                border-radius: 8px;
-                padding: 8px 16px;
-                border: 2px solid #7c3aed;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-                color: white;
-            }
-            QPushButton:pressed {
-                background-color: #5b21b6;
-                border-color: #5b21b6;
-            }
-        """)
+            btn.setStyleSheet(_BTN_SECONDARY_QSS)
 
         # Añadir sombra suave
         shadow = QGraphicsDropShadowEffect(btn)
@@ -1945,9 +2638,17 @@ class MatrixQtApp(QMainWindow):
         gl.addWidget(comb_wrap, 7, 0)
         self.center_layout.addWidget(cont)
 
+        # Último (op, forma A, forma B) mostrado: la vista se reconstruye en cada
+        # show_ops, así que la caché vive en el closure y no en self
+        compat_key = [None]
+
         def update_compat():
             A = (self.gridA.rowCount(), self.gridA.columnCount()); B = (self.gridB.rowCount(), self.gridB.columnCount())
             op = self.op_selector.currentText()
+            key = (op, A, B)
+            if key == compat_key[0]:
+                return
+            compat_key[0] = key
             if op.startswith('Producto'):
                 ok = (self.gridA.columnCount() == self.gridB.rowCount())
             else:
@@ -1973,48 +2674,53 @@ class MatrixQtApp(QMainWindow):
                         self.push_error('A y B deben tener la misma forma')
                         return
                     C = A + B; steps = add_steps(A,B)
-                    self.push_result('Suma de matrices (A + B)', np.round(C,2), 'Resultado de A + B', steps)
+                    self.push_result('Suma de matrices (A + B)', _round_owned(C), 'Resultado de A + B', steps)
                 elif op.startswith('Resta'):
                     if A.shape != B.shape:
                         self.push_error('A y B deben tener la misma forma')
                         return
                     C = A - B; steps = sub_steps(A,B)
-                    self.push_result('Resta de matrices (A - B)', np.round(C,2), 'Resultado de A - B', steps)
+                    self.push_result('Resta de matrices (A - B)', _round_owned(C), 'Resultado de A - B', steps)
                 elif op.startswith('Producto'):
                     if A.shape[1] != B.shape[0]:
                         self.push_error('Dimensiones incompatibles para multiplicación (cols de A ≠ filas de B)')
                         return
-                    C = A @ B; steps = multiply_steps(A,B)
-                    self.push_result('Producto de matrices (A · B)', np.round(C,2), 'Resultado de A · B', steps)
+                    C = multiply_result(A, B); steps = multiply_steps(A,B)
+                    self.push_result('Producto de matrices (A · B)', _round_owned(C), 'Resultado de A · B', steps)
                 else:
                     # Combinación lineal α·A + β·B
                     if A.shape != B.shape:
                         self.push_error('A y B deben tener la misma forma para la combinación lineal')
                         return
                     alpha = float(alpha_spin.value()); beta = float(beta_spin.value())
-                    steps = []
+                    Cmat = None
                     # If any coefficient is set to det(C), compute it
                     if alpha_det.isChecked() or beta_det.isChecked():
                         Cmat = self.gridC.get_matrix()
                         if Cmat.shape[0] != Cmat.shape[1]:
                             self.push_error('Para usar det(C), C debe ser cuadrada')
                             return
-                        det_steps = determinant_steps(Cmat)
-                        # last det is number, but determinant_steps returns steps of matrices; we can compute value here
-                        det_val = float(np.linalg.det(Cmat))
-                        steps.extend(det_steps)
+                        # Valor exacto (Bareiss) si C es entera; si no, una sola LU de
+                        # LAPACK. La eliminación paso a paso solo si se piden los pasos
+                        try:
+                            det_val = float(bareiss_det(Cmat))
+                        except ValueError:
+                            det_val = determinant_result(Cmat)
                         if alpha_det.isChecked():
                             alpha = det_val
                         if beta_det.isChecked():
                             beta = det_val
-                    # Build steps for scaling and sum
                     A1 = alpha * A; B1 = beta * B
-                    from sympy import Matrix as _SM
-                    steps.append((f"Escalar α·A (α = {alpha})", _SM(A1.tolist())))
-                    steps.append((f"Escalar β·B (β = {beta})", _SM(B1.tolist())))
                     R = A1 + B1
-                    steps.append(("Suma α·A + β·B", _SM(R.tolist())))
-                    self.push_result('Combinación lineal', np.round(R, 6), f"α·A + β·B (α={alpha}, β={beta})", steps)
+
+                    def build_steps(Cmat=Cmat, alpha=alpha, beta=beta, A1=A1, B1=B1, R=R):
+                        steps = list(determinant_steps(Cmat)) if Cmat is not None else []
+                        steps.append((f"Escalar α·A (α = {alpha})", A1))
+                        steps.append((f"Escalar β·B (β = {beta})", B1))
+                        steps.append(("Suma α·A + β·B", R))
+                        return steps
+                    # R lo comparte build_steps: se redondea una copia, no en sitio
+                    self.push_result('Combinación lineal', np.round(R, 6), f"α·A + β·B (α={alpha}, β={beta})", build_steps)
             except Exception as e:
                 self.push_error(str(e))
         calc.clicked.connect(do_calc)
@@ -2066,11 +2772,11 @@ class MatrixQtApp(QMainWindow):
         def calcular():
             try:
                 M = self.vgrid.get_matrix(); mat = M.T
-                rank = SMatrix(mat.tolist()).rank(); n_vecs = mat.shape[1]; dim = mat.shape[0]
+                # Solo hace falta el rango: SVD de LAPACK (más estable que pivoteo parcial)
+                rank = int(np.linalg.matrix_rank(mat)); n_vecs = mat.shape[1]; dim = mat.shape[0]
                 indep = rank == n_vecs
                 txt = f"Dimensión del espacio: {dim}\nNúmero de vectores: {n_vecs}\nRango: {rank}\nConclusión: {'INDEPENDIENTES' if indep else 'DEPENDIENTES'}"
-                steps = rref_steps(mat)
-                self.push_result('Independencia de vectores', np.round(mat,2), txt, steps)
+                self.push_result('Independencia de vectores', np.round(mat,2), txt, lambda: rref_steps(mat))
             except Exception as e:
                 self.push_result('Error', None, str(e))
         btn.clicked.connect(calcular)
@@ -2114,7 +2820,7 @@ class MatrixQtApp(QMainWindow):
         def calcular():
             try:
                 A = self.triu_grid.get_matrix(); steps = upper_triangular_steps(A)
-                final = np.round(np.array(steps[-1][1].tolist(), dtype=float), 2)
+                final = np.round(step_array(steps[-1][1]), 2)
                 self.push_result('Triangular superior (U)', final, 'Matriz U', steps)
             except Exception as e:
                 self.push_result('Error', None, str(e))
@@ -2157,9 +2863,8 @@ class MatrixQtApp(QMainWindow):
 
         def calcular():
             try:
-                A = self.rref_grid.get_matrix(); steps = rref_steps(A)
-                final = np.round(np.array(steps[-1][1].tolist(), dtype=float), 2)
-                self.push_result('RREF', final, f"Rango: {SMatrix(final.tolist()).rank()}", steps)
+                A = self.rref_grid.get_matrix(); R, rank = rref_result(A)
+                self.push_result('RREF', _round_owned(R), f"Rango: {rank}", lambda: rref_steps(A))
             except Exception as e:
                 self.push_result('Error', None, str(e))
         btn.clicked.connect(calcular)
@@ -2202,11 +2907,11 @@ class MatrixQtApp(QMainWindow):
                 tsteps = transpose_steps(A)
                 self.push_result('Transpuesta', T, 'Matriz transpuesta.', tsteps)
                 if A.shape[0] == A.shape[1]:
-                    isteps = inverse_steps(A)
-                    try:
-                        inv = np.linalg.inv(A); invr = np.round(inv, 2)
-                        self.push_result('Inversa', invr, 'Matriz inversa (si existe).', isteps)
-                    except np.linalg.LinAlgError:
+                    isteps = lambda: inverse_steps(A)
+                    inv = inverse_result(A)
+                    if inv is not None:
+                        self.push_result('Inversa', _round_owned(inv), 'Matriz inversa (si existe).', isteps)
+                    else:
                         self.push_result('Inversa', None, 'La matriz no es invertible.', isteps)
                 else:
                     self.push_result('Transpuesta / Inversa', T, 'La matriz no es cuadrada, no existe inversa.')
@@ -2251,9 +2956,8 @@ class MatrixQtApp(QMainWindow):
                 A = self.det_grid.get_matrix()
                 if A.shape[0] != A.shape[1]:
                     self.push_result('Determinante', None, 'Solo para matrices cuadradas'); return
-                steps = determinant_steps(A)
-                d = float(np.linalg.det(A))
-                self.push_result('Determinante', None, f'det(A) = {fmt_num(d, 6)}', steps)
+                d = determinant_result(A)
+                self.push_result('Determinante', None, f'det(A) = {fmt_num(d, 6)}', lambda: determinant_steps(A))
             except Exception as e:
                 self.push_result('Error', None, str(e))
         btn.clicked.connect(calcular)
@@ -2349,10 +3053,10 @@ class MatrixQtApp(QMainWindow):
         )
 
         fn_row = QHBoxLayout(); box.addLayout(fn_row)
-        lbl_fn = QLabel('f(x) ='); lbl_fn.setStyleSheet(f"font-family:{MATH_FONT_STACK}; font-size:14px;")
+        lbl_fn = QLabel('f(x) ='); lbl_fn.setObjectName('mathFnLabel')
         fn_row.addWidget(lbl_fn)
         expr_edit = QLineEdit(''); expr_edit.setPlaceholderText('Expresión en x, p.ej. x**3 - x - 2')
-        expr_edit.setStyleSheet(f"font-family:{MATH_FONT_STACK}; font-size:13px;")
+        expr_edit.setObjectName('mathInput')
         expr_edit.setFixedHeight(28)
         fn_row.addWidget(expr_edit, 1)
 
@@ -2384,16 +3088,15 @@ class MatrixQtApp(QMainWindow):
             pass
 
         self.center_layout.addWidget(panel)
+        required_spins = (xi_spin, xu_spin, eps_spin, itmax)
         def calc():
             try:
                 expr_text = expr_edit.text().strip()
                 if not expr_text:
                     self.push_error('Escribe una expresión para f(x).'); return
-                def _is_empty(sp):
-                    return (sp.specialValueText()=='' and sp.value()==sp.minimum())
-                if any(_is_empty(sp) for sp in (xi_spin, xu_spin, eps_spin, itmax)):
+                if any(_spin_is_empty(sp) for sp in required_spins):
                     self.push_error('Completa xi, xu, ε e iter máx.'); return
-                x = _SYM_symbols('x'); expr = _SYM_sympify(expr_text); f = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
+                f = _compile_expr(expr_text)
                 xi = float(xi_spin.value()); xu = float(xu_spin.value())
                 if not (xi < xu):
                     self.push_error('Debe cumplirse xi < xu.'); return
@@ -2405,11 +3108,13 @@ class MatrixQtApp(QMainWindow):
                 eps_text = eps_spin.text().strip(); eps = float(eps_spin.value()); max_iter = int(itmax.value())
                 if max_iter <= 0:
                     self.push_error('Iteraciones máximas debe ser > 0.'); return
-                rows = []; xr_old = None; xi_c, xu_c, yi_c, yu_c = xi, xu, yi, yu
+                # Tabla preasignada (xi, xu, xr, Ea, yi, yu, yr) por iteración; las
+                # tuplas para la UI se arman una sola vez al final
+                tab = np.empty((max_iter, 7)); n = 0; xr_old = None; xi_c, xu_c, yi_c, yu_c = xi, xu, yi, yu
                 for it in range(1, max_iter+1):
                     xr = 0.5*(xi_c + xu_c); yr = float(f(xr))
                     Ea = 0.0 if xr_old is None else (abs((xr - xr_old)/xr) if xr != 0 else abs(xr - xr_old))
-                    rows.append((it, xi_c, xu_c, xr, Ea, yi_c, yu_c, yr))
+                    tab[n] = (xi_c, xu_c, xr, Ea, yi_c, yu_c, yr); n += 1
                     if xr_old is not None and Ea <= eps:
                         break
                     if yi_c * yr < 0:
@@ -2417,6 +3122,7 @@ class MatrixQtApp(QMainWindow):
                     else:
                         xi_c, yi_c = xr, yr
                     xr_old = xr
+                rows = [(it, *vals) for it, vals in enumerate(tab[:n].tolist(), 1)]
                 self._push_bisect_summary_card(expr_text, xi, xu, rows, eps_text)
                 self._show_bisect_dialog(expr_text, xi, xu, rows, eps_text)
             except Exception as e:
@@ -2424,13 +3130,12 @@ class MatrixQtApp(QMainWindow):
         calc_btn.clicked.connect(calc)
         def fill_random():
             try:
-                x = _SYM_symbols('x')
                 def build_expr_text():
-                    choice = np.random.choice(['poly','sin','poly_sin','exp'])
+                    choice = _RNG.choice(['poly','sin','poly_sin','exp'])
                     if choice == 'poly':
-                        deg = int(np.random.randint(2,5)); coeffs = list(np.random.randint(-5,6,size=deg+1))
+                        deg = int(_RNG.integers(2,5)); coeffs = list(_RNG.integers(-5,6,size=deg+1))
                         while coeffs[0] == 0:
-                            coeffs[0] = int(np.random.randint(-5,6))
+                            coeffs[0] = int(_RNG.integers(-5,6))
                         terms=[]; p=deg
                         for c in coeffs:
                             if p>1: terms.append(f"{c}*x**{p}")
@@ -2439,23 +3144,23 @@ class MatrixQtApp(QMainWindow):
                             p-=1
                         return ' + '.join(terms).replace('+ -','- ')
                     elif choice == 'sin':
-                        a=int(np.random.randint(1,4)); b=int(np.random.randint(1,4)); d=int(np.random.randint(-2,3)); return f"{a}*sin({b}*x) + {d}"
+                        a=int(_RNG.integers(1,4)); b=int(_RNG.integers(1,4)); d=int(_RNG.integers(-2,3)); return f"{a}*sin({b}*x) + {d}"
                     elif choice == 'poly_sin':
-                        a=int(np.random.randint(-3,4)); b=int(np.random.randint(1,4)); c=int(np.random.randint(-2,3)); d=int(np.random.randint(-2,3));
+                        a=int(_RNG.integers(-3,4)); b=int(_RNG.integers(1,4)); c=int(_RNG.integers(-2,3)); d=int(_RNG.integers(-2,3));
                         if a==0: a=1; return f"{a}*x**2 + {b}*sin(x) + {c}*x + {d}"
                     else:
-                        a=int(np.random.randint(1,4)); b=float(np.random.choice([0.3,0.5,1.0])); cst=int(np.random.randint(0,4)); return f"{a}*exp({b}*x) - {cst}"
+                        a=int(_RNG.integers(1,4)); b=float(_RNG.choice([0.3,0.5,1.0])); cst=int(_RNG.integers(0,4)); return f"{a}*exp({b}*x) - {cst}"
                 for _ in range(12):
-                    expr_text = build_expr_text(); expr = _SYM_sympify(expr_text); f = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
-                    xs = np.linspace(-5.0,5.0,400); ys = np.asarray(f(xs), dtype=float); finite = np.isfinite(ys); found=False
-                    for i in range(len(xs)-1):
-                        if not (finite[i] and finite[i+1]): continue
-                        if ys[i] == 0:
-                            xi_val = float(xs[i] - 0.5*(xs[1]-xs[0])); xu_val = float(xs[i] + 0.5*(xs[1]-xs[0])); found=True; break
-                        if ys[i]*ys[i+1] < 0:
-                            xi_val = float(xs[i]); xu_val = float(xs[i+1]); found=True; break
+                    expr_text = build_expr_text(); f = _compile_expr(expr_text)
+                    xs = np.linspace(-5.0,5.0,400); ys = np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape)
+                    hit = _first_sign_change(ys); found = hit is not None
                     if found:
-                        eps_val = float(np.random.choice([1e-2,5e-3,1e-3,5e-4,1e-4])); it_val = int(np.random.randint(18,45))
+                        i, at_zero = hit
+                        if at_zero:
+                            xi_val = float(xs[i] - 0.5*(xs[1]-xs[0])); xu_val = float(xs[i] + 0.5*(xs[1]-xs[0]))
+                        else:
+                            xi_val = float(xs[i]); xu_val = float(xs[i+1])
+                        eps_val = float(_RNG.choice([1e-2,5e-3,1e-3,5e-4,1e-4])); it_val = int(_RNG.integers(18,45))
                         expr_edit.setText(expr_text); xi_spin.setValue(xi_val); xu_spin.setValue(xu_val); eps_spin.setValue(eps_val); itmax.setValue(it_val); return
                 expr_edit.setText('x**3 - x - 2'); xi_spin.setValue(1.0); xu_spin.setValue(2.0); eps_spin.setValue(1e-4); itmax.setValue(25)
             except Exception as e:
@@ -2516,17 +3221,25 @@ class MatrixQtApp(QMainWindow):
 
     def _show_bisect_dialog(self, expr_text: str, xi: float, xu: float, rows, eps_text: str | None = None):
         try:
-            dlg = BisectionResultDialog(expr_text, xi, xu, rows, eps_text, self)
-            dlg.setAttribute(Qt.WA_DeleteOnClose, True)
-            self._dialogs.append(dlg)
-            def _cleanup():
-                if dlg in self._dialogs:
-                    self._dialogs.remove(dlg)
-            dlg.destroyed.connect(lambda *_: _cleanup())
-            dlg.show()
+            if self._bisect_pool:
+                dlg = self._bisect_pool.pop()
+                dlg.set_payload(expr_text, xi, xu, rows, eps_text)
+            else:
+                dlg = BisectionResultDialog(expr_text, xi, xu, rows, eps_text, self)
+                dlg.finished.connect(lambda *_: self._release_bisect_dialog(dlg))
+            dlg.show(); dlg.raise_()
         except Exception as e:
             self.push_error(str(e))
 
+    def _release_bisect_dialog(self, dlg: BisectionResultDialog):
+        """Al cerrarse (X, Esc o done) el diálogo vuelve al pool oculto; si está lleno se destruye."""
+        if dlg in self._bisect_pool:
+            return
+        if len(self._bisect_pool) < _DIALOG_POOL_SIZE:
+            self._bisect_pool.append(dlg)
+        else:
+            dlg.deleteLater()
+
     # -------------------------------
     # Método de Falsa Posición (Regla Falsa)
     # -------------------------------
@@ -2546,10 +3259,10 @@ class MatrixQtApp(QMainWindow):
         # Function input
         fn_row = QHBoxLayout(); box.addLayout(fn_row)
         lbl_fn = QLabel('f(x) =')
-        lbl_fn.setStyleSheet(f"font-family: {MATH_FONT_STACK}; font-size:14px;")
+        lbl_fn.setObjectName('mathFnLabel')
         fn_row.addWidget(lbl_fn)
         expr_edit = QLineEdit(""); expr_edit.setPlaceholderText("Expresión en x, p.ej. x**3 - x - 2")
-        expr_edit.setStyleSheet(f"font-family: {MATH_FONT_STACK}; font-size:13px;")
+        expr_edit.setObjectName('mathInput')
         expr_edit.setFixedHeight(28)
         fn_row.addWidget(expr_edit, 1)
 
@@ -2592,18 +3305,15 @@ class MatrixQtApp(QMainWindow):
         except Exception:
             pass
 
+        required_spins = (xi_spin, xu_spin, eps_spin, itmax)
         def calc():
             try:
                 expr_text = expr_edit.text().strip()
                 if not expr_text:
                     self.push_error('Escribe una expresión para f(x).'); return
-                def _is_empty_spin(sp):
-                    return (sp.specialValueText()=='' and sp.value()==sp.minimum())
-                if any([_is_empty_spin(x) for x in (xi_spin, xu_spin, eps_spin, itmax)]):
+                if any(_spin_is_empty(sp) for sp in required_spins):
                     self.push_error('Completa xi, xu, ε e iter máx.'); return
-                x = _SYM_symbols('x')
-                expr = _SYM_sympify(expr_text)
-                f = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
+                f = _compile_expr(expr_text)
                 xi = float(xi_spin.value()); xu = float(xu_spin.value())
                 if not (xi < xu):
                     self.push_error('Debe cumplirse xi < xu.'); return
@@ -2650,14 +3360,13 @@ class MatrixQtApp(QMainWindow):
 
         def fill_random():
             try:
-                x = _SYM_symbols('x')
                 def build_expr_text():
-                    choice = np.random.choice(['poly', 'sin', 'poly_sin', 'exp'])
+                    choice = _RNG.choice(['poly', 'sin', 'poly_sin', 'exp'])
                     if choice == 'poly':
-                        deg = int(np.random.randint(2, 5))
-                        coeffs = list(np.random.randint(-5, 6, size=deg+1))
+                        deg = int(_RNG.integers(2, 5))
+                        coeffs = list(_RNG.integers(-5, 6, size=deg+1))
                         while coeffs[0] == 0:
-                            coeffs[0] = int(np.random.randint(-5, 6))
+                            coeffs[0] = int(_RNG.integers(-5, 6))
                         terms = []
                         p = deg
                         for c in coeffs:
@@ -2670,42 +3379,34 @@ class MatrixQtApp(QMainWindow):
                             p -= 1
                         return ' + '.join(terms).replace('+ -', '- ')
                     elif choice == 'sin':
-                        a = int(np.random.randint(1, 4)); b = int(np.random.randint(1, 4)); d = int(np.random.randint(-2, 3))
+                        a = int(_RNG.integers(1, 4)); b = int(_RNG.integers(1, 4)); d = int(_RNG.integers(-2, 3))
                         return f"{a}*sin({b}*x) + {d}"
                     elif choice == 'poly_sin':
-                        a = int(np.random.randint(-3, 4)); b = int(np.random.randint(1, 4)); c = int(np.random.randint(-2, 3)); d = int(np.random.randint(-2, 3))
+                        a = int(_RNG.integers(-3, 4)); b = int(_RNG.integers(1, 4)); c = int(_RNG.integers(-2, 3)); d = int(_RNG.integers(-2, 3))
                         if a == 0: a = 1
                         return f"{a}*x**2 + {b}*sin(x) + {c}*x + {d}"
                     else:
-                        a = int(np.random.randint(1, 4)); b = float(np.random.choice([0.3, 0.5, 1.0]))
-                        cst = int(np.random.randint(0, 4))
+                        a = int(_RNG.integers(1, 4)); b = float(_RNG.choice([0.3, 0.5, 1.0]))
+                        cst = int(_RNG.integers(0, 4))
                         return f"{a}*exp({b}*x) - {cst}"
 
                 for _ in range(12):
                     expr_text = build_expr_text()
-                    expr = _SYM_sympify(expr_text)
-                    f = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
+                    f = _compile_expr(expr_text)
                     xs = np.linspace(-5.0, 5.0, 400)
-                    ys = f(xs)
-                    ys = np.asarray(ys, dtype=float)
-                    finite = np.isfinite(ys)
-                    found = False
-                    for i in range(len(xs)-1):
-                        if not (finite[i] and finite[i+1]):
-                            continue
-                        if ys[i] == 0:
+                    ys = np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape)
+                    hit = _first_sign_change(ys)
+                    found = hit is not None
+                    if found:
+                        i, at_zero = hit
+                        if at_zero:
                             xi_val = float(xs[i] - 0.5*(xs[1]-xs[0]))
                             xu_val = float(xs[i] + 0.5*(xs[1]-xs[0]))
-                            found = True
-                            break
-                        if ys[i] * ys[i+1] < 0:
+                        else:
                             xi_val = float(xs[i])
                             xu_val = float(xs[i+1])
-                            found = True
-                            break
-                    if found:
-                        eps_val = float(np.random.choice([1e-2, 5e-3, 1e-3, 5e-4, 1e-4]))
-                        it_val = int(np.random.randint(18, 45))
+                        eps_val = float(_RNG.choice([1e-2, 5e-3, 1e-3, 5e-4, 1e-4]))
+                        it_val = int(_RNG.integers(18, 45))
                         expr_edit.setText(expr_text)
                         xi_spin.setValue(xi_val)
                         xu_spin.setValue(xu_val)
@@ -2741,10 +3442,10 @@ class MatrixQtApp(QMainWindow):
             wrap.layout().setContentsMargins(20, 8, 20, 18)
 
         fn_row = QHBoxLayout(); box.addLayout(fn_row)
-        lbl_fn = QLabel('f(x) ='); lbl_fn.setStyleSheet(f"font-family:{MATH_FONT_STACK}; font-size:14px;")
+        lbl_fn = QLabel('f(x) ='); lbl_fn.setObjectName('mathFnLabel')
         fn_row.addWidget(lbl_fn)
         expr_edit = QLineEdit(''); expr_edit.setPlaceholderText('Ejemplo: x**3 - x - 2')
-        expr_edit.setStyleSheet(f"font-family:{MATH_FONT_STACK}; font-size:13px;")
+        expr_edit.setObjectName('mathInput')
         expr_edit.setFixedHeight(28)
         fn_row.addWidget(expr_edit, 1)
 
@@ -2793,11 +3494,6 @@ class MatrixQtApp(QMainWindow):
         except Exception:
             pass
 
-        def _is_empty(spin: TrimDoubleSpinBox | QSpinBox):
-            if isinstance(spin, TrimDoubleSpinBox):
-                return spin.specialValueText() == '' and spin.value() == spin.minimum()
-            return spin.specialValueText() == '' and spin.value() == spin.minimum()
-
         def calc():
             try:
                 calc_btn.setEnabled(False)
@@ -2806,12 +3502,10 @@ class MatrixQtApp(QMainWindow):
                 if not expr_text:
                     error_label.setText('Escribe una expresión para f(x).')
                     return
-                if any(_is_empty(sp) for sp in (x0_spin, x1_spin, eps_spin, itmax)):
+                if any(_spin_is_empty(sp) for sp in (x0_spin, x1_spin, eps_spin, itmax)):
                     error_label.setText('Completa x₀, x₁, ε e iter máx.')
                     return
-                x = _SYM_symbols('x')
-                expr = _SYM_sympify(expr_text)
-                f = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
+                f = _compile_expr(expr_text)
 
                 x0 = float(x0_spin.value()); x1 = float(x1_spin.value())
                 if not (np.isfinite(x0) and np.isfinite(x1)):
@@ -2868,25 +3562,23 @@ class MatrixQtApp(QMainWindow):
 
         def fill_random():
             try:
-                x = _SYM_symbols('x')
                 def build_expr_text():
-                    choice = np.random.choice(['poly','sin','exp'])
+                    choice = _RNG.choice(['poly','sin','exp'])
                     if choice == 'poly':
-                        a = int(np.random.randint(-3, 4) or 1)
-                        b = int(np.random.randint(-5, 6))
-                        c = int(np.random.randint(-5, 6))
+                        a = int(_RNG.integers(-3, 4) or 1)
+                        b = int(_RNG.integers(-5, 6))
+                        c = int(_RNG.integers(-5, 6))
                         return f"{a}*x**2 + {b}*x + {c}"
                     if choice == 'sin':
-                        k = int(np.random.randint(1, 4))
+                        k = int(_RNG.integers(1, 4))
                         return f"sin({k}*x) - 0.5"
                     return "exp(x) - 3"
 
                 expr_text = build_expr_text()
-                expr = _SYM_sympify(expr_text)
-                f = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
+                _compile_expr(expr_text)  # valida (y deja en caché) la expresión
                 # Buscar dos puntos cercanos con valores distintos
-                x0_val = float(np.random.uniform(-3, 0))
-                x1_val = x0_val + float(np.random.uniform(0.5, 2.0))
+                x0_val = float(_RNG.uniform(-3, 0))
+                x1_val = x0_val + float(_RNG.uniform(0.5, 2.0))
                 expr_edit.setText(expr_text)
                 x0_spin.setValue(x0_val)
                 x1_spin.setValue(x1_val)
@@ -2913,8 +3605,7 @@ class MatrixQtApp(QMainWindow):
             return
 
         try:
-            import matplotlib.pyplot as plt
-            import numpy as np  # por si no está en el ámbito local
+            import matplotlib.pyplot as plt  # pyplot solo si se pide la gráfica
         except Exception:
             return
 
@@ -2989,10 +3680,10 @@ class MatrixQtApp(QMainWindow):
         )
 
         fn_row = QHBoxLayout(); box.addLayout(fn_row)
-        lbl_fn = QLabel('f(x) ='); lbl_fn.setStyleSheet(f"font-family:{MATH_FONT_STACK}; font-size:14px;")
+        lbl_fn = QLabel('f(x) ='); lbl_fn.setObjectName('mathFnLabel')
         fn_row.addWidget(lbl_fn)
         expr_edit = QLineEdit(''); expr_edit.setPlaceholderText('Ejemplo: x**3 - x - 2')
-        expr_edit.setStyleSheet(f"font-family:{MATH_FONT_STACK}; font-size:13px;")
+        expr_edit.setObjectName('mathInput')
         expr_edit.setFixedHeight(28)
         fn_row.addWidget(expr_edit, 1)
 
@@ -3056,7 +3747,7 @@ class MatrixQtApp(QMainWindow):
 
         auto_page = QWidget(); auto_layout = QVBoxLayout(auto_page); auto_layout.setContentsMargins(0, 0, 0, 0)
         auto_layout.setSpacing(6)
-        auto_preview = QLabel("f'(x) = —"); auto_preview.setStyleSheet(f"font-family:{MATH_FONT_STACK}; background:#15171a; border:1px solid #2b2d31; border-radius:8px; padding:10px;")
+        auto_preview = QLabel("f'(x) = —"); auto_preview.setObjectName('derivPreview')
         auto_preview.setTextFormat(Qt.RichText)
         auto_preview.setWordWrap(True)
         auto_preview.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
@@ -3066,7 +3757,7 @@ class MatrixQtApp(QMainWindow):
         manual_page = QWidget(); manual_layout = QVBoxLayout(manual_page); manual_layout.setContentsMargins(0,0,0,0)
         manual_layout.setSpacing(6)
         manual_edit = QLineEdit(''); manual_edit.setPlaceholderText("Escribe aquí f'(x)")
-        manual_edit.setStyleSheet(f"font-family:{MATH_FONT_STACK}; font-size:13px;")
+        manual_edit.setObjectName('mathInput')
         manual_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         manual_layout.addWidget(manual_edit)
         manual_layout.addWidget(self._build_math_keyboard(manual_edit))
@@ -3101,9 +3792,7 @@ class MatrixQtApp(QMainWindow):
                 auto_preview.setText("f'(x) = —")
                 return
             try:
-                x = _SYM_symbols('x')
-                expr = _SYM_sympify(text)
-                derivative = _SYM_diff(expr, x)
+                derivative = _derivative(text)
                 auto_state['expr'] = derivative
                 auto_state['text'] = str(derivative)
                 escaped = html.escape(auto_state['text'])
@@ -3113,40 +3802,44 @@ class MatrixQtApp(QMainWindow):
                 auto_state['text'] = ''
                 auto_preview.setText("f'(x) = (expresión inválida)")
 
-        expr_edit.textChanged.connect(refresh_auto)
+        # Al teclear, cada prefijo se parseaba y derivaba (y ocupaba las cachés
+        # de _parse_expr/_derivative); se espera a una pausa en la escritura.
+        auto_timer = QTimer(deriv_card); auto_timer.setSingleShot(True); auto_timer.setInterval(200)
+        auto_timer.timeout.connect(refresh_auto)
+        expr_edit.textChanged.connect(lambda _=None: auto_timer.start())
         refresh_auto()
 
+        def flush_auto():
+            # Refresco pendiente: aplicarlo antes de usar auto_state
+            if auto_timer.isActive():
+                auto_timer.stop(); refresh_auto()
+
         def copy_auto_to_manual():
+            flush_auto()
             if auto_state['text']:
                 manual_edit.setText(auto_state['text'])
         copy_btn.clicked.connect(copy_auto_to_manual)
 
-        def _is_empty(spin: TrimDoubleSpinBox | QSpinBox):
-            if isinstance(spin, TrimDoubleSpinBox):
-                return spin.specialValueText() == '' and spin.value() == spin.minimum()
-            return spin.specialValueText() == '' and spin.value() == spin.minimum()
-
         def calc():
             try:
+                flush_auto()
                 expr_text = expr_edit.text().strip()
                 if not expr_text:
                     self.push_error('Escribe una expresión para f(x).'); return
-                if any(_is_empty(sp) for sp in (x0_spin, eps_spin, itmax)):
+                if any(_spin_is_empty(sp) for sp in (x0_spin, eps_spin, itmax)):
                     self.push_error('Completa x₀, ε e iter máx.'); return
-                x = _SYM_symbols('x')
-                expr = _SYM_sympify(expr_text)
-                f = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
+                f = _compile_expr(expr_text)
                 if mode_switch.isChecked():
                     d_text = manual_edit.text().strip()
                     if not d_text:
                         self.push_error('Ingresa la expresión de f\'(x) en modo manual.'); return
-                    d_expr = _SYM_sympify(d_text)
+                    d_expr = _parse_expr(d_text)
                 else:
                     if auto_state['expr'] is None:
-                        auto_state['expr'] = _SYM_diff(expr, x)
+                        auto_state['expr'] = _derivative(expr_text)
                         auto_state['text'] = str(auto_state['expr'])
                     d_expr = auto_state['expr']
-                df = _SYM_lambdify(x, d_expr, _LAMBDA_MODULES)
+                df = _compile_sym(d_expr)
                 x0_value = float(x0_spin.value())
                 if not np.isfinite(x0_value):
                     self.push_error('x₀ debe ser un número finito.'); return
@@ -3204,14 +3897,13 @@ class MatrixQtApp(QMainWindow):
 
         def fill_random():
             try:
-                x = _SYM_symbols('x')
                 def build_expr_text():
-                    choice = np.random.choice(['poly','sin','poly_sin','exp'])
+                    choice = _RNG.choice(['poly','sin','poly_sin','exp'])
                     if choice == 'poly':
-                        deg = int(np.random.randint(2, 5))
-                        coeffs = list(np.random.randint(-5, 6, size=deg+1))
+                        deg = int(_RNG.integers(2, 5))
+                        coeffs = list(_RNG.integers(-5, 6, size=deg+1))
                         while coeffs[0] == 0:
-                            coeffs[0] = int(np.random.randint(-5, 6))
+                            coeffs[0] = int(_RNG.integers(-5, 6))
                         terms = []; power = deg
                         for c in coeffs:
                             if power > 1:
@@ -3223,38 +3915,28 @@ class MatrixQtApp(QMainWindow):
                             power -= 1
                         return ' + '.join(terms).replace('+ -', '- ')
                     if choice == 'sin':
-                        a = int(np.random.randint(1, 4)); b = int(np.random.randint(1, 4)); d = int(np.random.randint(-2, 3))
+                        a = int(_RNG.integers(1, 4)); b = int(_RNG.integers(1, 4)); d = int(_RNG.integers(-2, 3))
                         return f"{a}*sin({b}*x) + {d}"
                     if choice == 'poly_sin':
-                        a = int(np.random.randint(-3, 4)); b = int(np.random.randint(1, 4)); c = int(np.random.randint(-2, 3)); d = int(np.random.randint(-2, 3))
+                        a = int(_RNG.integers(-3, 4)); b = int(_RNG.integers(1, 4)); c = int(_RNG.integers(-2, 3)); d = int(_RNG.integers(-2, 3))
                         if a == 0:
                             a = 1
                         return f"{a}*x**2 + {b}*sin(x) + {c}*x + {d}"
-                    a = int(np.random.randint(1, 4)); b = float(np.random.choice([0.3, 0.5, 1.0])); cst = int(np.random.randint(0, 4))
+                    a = int(_RNG.integers(1, 4)); b = float(_RNG.choice([0.3, 0.5, 1.0])); cst = int(_RNG.integers(0, 4))
                     return f"{a}*exp({b}*x) - {cst}"
 
                 for _ in range(12):
                     expr_text = build_expr_text()
-                    expr = _SYM_sympify(expr_text)
-                    f = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
+                    f = _compile_expr(expr_text)
                     xs = np.linspace(-5.0, 5.0, 400)
-                    ys = np.asarray(f(xs), dtype=float)
-                    finite = np.isfinite(ys)
-                    found = False
-                    for i in range(len(xs)-1):
-                        if not (finite[i] and finite[i+1]):
-                            continue
-                        if ys[i] == 0:
-                            x0_val = float(xs[i])
-                            found = True
-                            break
-                        if ys[i] * ys[i+1] < 0:
-                            x0_val = float(0.5 * (xs[i] + xs[i+1]))
-                            found = True
-                            break
+                    ys = np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape)
+                    hit = _first_sign_change(ys)
+                    found = hit is not None
                     if found:
-                        eps_val = float(np.random.choice([1e-2, 5e-3, 1e-3, 5e-4, 1e-4]))
-                        it_val = int(np.random.randint(12, 35))
+                        i, at_zero = hit
+                        x0_val = float(xs[i]) if at_zero else float(0.5 * (xs[i] + xs[i+1]))
+                        eps_val = float(_RNG.choice([1e-2, 5e-3, 1e-3, 5e-4, 1e-4]))
+                        it_val = int(_RNG.integers(12, 35))
                         expr_edit.setText(expr_text)
                         x0_spin.setValue(x0_val)
                         eps_spin.setValue(eps_val)
@@ -3320,12 +4002,8 @@ class MatrixQtApp(QMainWindow):
     def _show_falsepos_dialog(self, expr_text: str, xi: float, xu: float, rows, eps_text: str | None = None):
         try:
             dlg = FalsePositionResultDialog(expr_text, xi, xu, rows, eps_text, self)
+            # El padre (self) lo mantiene vivo; WA_DeleteOnClose lo libera al cerrar
             dlg.setAttribute(Qt.WA_DeleteOnClose, True)
-            self._dialogs.append(dlg)
-            def _cleanup():
-                if dlg in self._dialogs:
-                    self._dialogs.remove(dlg)
-            dlg.destroyed.connect(lambda *_: _cleanup())
             dlg.show()
         except Exception as e:
             self.push_error(str(e))
@@ -3382,12 +4060,8 @@ class MatrixQtApp(QMainWindow):
     def _show_secant_dialog(self, expr_text: str, x0: float, x1: float, rows, eps_text: str | None = None):
         try:
             dlg = SecantResultDialog(expr_text, x0, x1, rows, eps_text, self)
+            # El padre (self) lo mantiene vivo; WA_DeleteOnClose lo libera al cerrar
             dlg.setAttribute(Qt.WA_DeleteOnClose, True)
-            self._dialogs.append(dlg)
-            def _cleanup():
-                if dlg in self._dialogs:
-                    self._dialogs.remove(dlg)
-            dlg.destroyed.connect(lambda *_: _cleanup())
             dlg.show()
         except Exception as e:
             self.push_error(str(e))
@@ -3403,7 +4077,7 @@ class MatrixQtApp(QMainWindow):
             try:
                 fig = Figure(figsize=(4.8, 2.2), dpi=110)
                 ax = fig.add_subplot(111)
-                x = _SYM_symbols('x'); expr = _SYM_sympify(expr_text); fcall = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
+                fcall = _compile_expr(expr_text)
                 xs_iter = [row[1] for row in rows] + [rows[-1][4]]
                 if xs_iter:
                     min_x, max_x = min(xs_iter), max(xs_iter)
@@ -3502,12 +4176,8 @@ class MatrixQtApp(QMainWindow):
         try:
             geo_url = self._build_geogebra_url(expr_text, x0_value, root_estimate)
             dlg = NewtonResultDialog(expr_text, deriv_text, rows, eps_text, manual_derivative, geo_url, self)
+            # El padre (self) lo mantiene vivo; WA_DeleteOnClose lo libera al cerrar
             dlg.setAttribute(Qt.WA_DeleteOnClose, True)
-            self._dialogs.append(dlg)
-            def _cleanup():
-                if dlg in self._dialogs:
-                    self._dialogs.remove(dlg)
-            dlg.destroyed.connect(lambda *_: _cleanup())
             dlg.show()
         except Exception as e:
             self.push_error(str(e))
@@ -3532,9 +4202,7 @@ class FalsePositionResultDialog(QDialog):
         try:
             fig = Figure(figsize=(6,3.5), dpi=100)
             ax = fig.add_subplot(111)
-            x = _SYM_symbols('x'); expr = _SYM_sympify(expr_text); fcall = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
-            xs = np.linspace(xi, xu, 400)
-            ys = fcall(xs)
+            xs, ys = _eval_curve(expr_text, float(xi), float(xu))
             ax.axhline(0, color='#666', lw=1)
             ax.plot(xs, ys, color='#4fc3f7', label='f(x)')
             if rows:
@@ -3570,20 +4238,7 @@ class FalsePositionResultDialog(QDialog):
             if isinstance(w, QLabel):
                 w.setStyleSheet("color:#ddd;")
 
-        tbl = QTableWidget()
-        headers = ['iteración','xi','xu','xr','Ea','yi','yu','yr']
-        tbl.setColumnCount(len(headers)); tbl.setHorizontalHeaderLabels(headers)
-        tbl.setRowCount(len(rows))
-        def fmt(v):
-            return ('+' if v>=0 else '') + f"{v:.6f}"
-        for r, row in enumerate(rows):
-            for c, v in enumerate(row):
-                item = QTableWidgetItem(fmt(v) if isinstance(v, float) or isinstance(v, np.floating) else str(v))
-                item.setTextAlignment(Qt.AlignRight|Qt.AlignVCenter)
-                tbl.setItem(r,c,item)
-        tbl.resizeColumnsToContents()
-        tbl.setAlternatingRowColors(True)
-        tbl.setStyleSheet(f"QTableWidget::item{{font-family:{MATH_FONT_STACK}; padding:4px;}}")
+        tbl = _iteration_view(['iteración','xi','xu','xr','Ea','yi','yu','yr'], rows, 6)
 
         lay.addWidget(header)
         lay.addWidget(tbl)
@@ -3644,25 +4299,8 @@ class SecantResultDialog(QDialog):
         btn_plot.clicked.connect(_show_plot)
         lay.addWidget(btn_plot)
 
-        tbl = QTableWidget(); lay.addWidget(tbl)
         headers = ['iteración','x_{n-1}','x_n','f(x_{n-1})','f(x_n)','x_{n+1}','Error aprox. (%)','|f(x_{n+1})|']
-        tbl.setColumnCount(len(headers)); tbl.setHorizontalHeaderLabels(headers)
-        tbl.setRowCount(len(rows))
-        def fmt(v):
-            return ('+' if v >= 0 else '') + f"{v:.{SECANT_DECIMALS}f}"
-        for r, row in enumerate(rows):
-            for c, v in enumerate(row):
-                text = fmt(v) if isinstance(v, (float, np.floating)) else str(v)
-                item = QTableWidgetItem(text)
-                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                if r == len(rows) - 1:
-                    item.setBackground(QColor(0, 80, 120, 160))
-                    item.setForeground(QColor('#ffffff'))
-                    font = item.font(); font.setBold(True); item.setFont(font)
-                tbl.setItem(r, c, item)
-        tbl.resizeColumnsToContents()
-        tbl.setAlternatingRowColors(True)
-        tbl.setStyleSheet(f"QTableWidget::item{{font-family:{MATH_FONT_STACK}; padding:4px;}}")
+        tbl = _iteration_view(headers, rows, SECANT_DECIMALS, highlight_last=True); lay.addWidget(tbl)
 
 
 class NewtonResultDialog(QDialog):
@@ -3686,7 +4324,7 @@ class NewtonResultDialog(QDialog):
         try:
             fig = Figure(figsize=(6,3.4), dpi=100)
             ax = fig.add_subplot(111)
-            x = _SYM_symbols('x'); expr = _SYM_sympify(expr_text); fcall = _SYM_lambdify(x, expr, _LAMBDA_MODULES)
+            fcall = _compile_expr(expr_text)
             xs_iter = [row[1] for row in rows] + ([rows[-1][4]] if rows else [])
             if xs_iter:
                 min_x, max_x = min(xs_iter), max(xs_iter)
@@ -3748,21 +4386,8 @@ class NewtonResultDialog(QDialog):
         link_row.addWidget(link_btn)
         lay.addLayout(link_row)
 
-        tbl = QTableWidget(); columns = ['iteración','x_n','f(x_n)','f\'(x_n)','x_{n+1}','Ea','|f(x_{n+1})|']
-        tbl.setColumnCount(len(columns)); tbl.setHorizontalHeaderLabels(columns)
-        tbl.setRowCount(len(rows))
-        def fmt(v):
-            return ('+' if v >= 0 else '') + f"{v:.6f}"
-        for r, row in enumerate(rows):
-            data = [row[0], row[1], row[2], row[3], row[4], row[5], row[6]]
-            for c, val in enumerate(data):
-                text = fmt(val) if isinstance(val, (float, np.floating)) else str(val)
-                item = QTableWidgetItem(text)
-                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                tbl.setItem(r, c, item)
-        tbl.resizeColumnsToContents()
-        tbl.setAlternatingRowColors(True)
-        tbl.setStyleSheet(f"QTableWidget::item{{font-family:{MATH_FONT_STACK}; padding:4px;}}")
+        columns = ['iteración','x_n','f(x_n)','f\'(x_n)','x_{n+1}','Ea','|f(x_{n+1})|']
+        tbl = _iteration_view(columns, rows, 6)  # solo las 7 primeras columnas de cada fila
         lay.addWidget(tbl)
 
         link_btn.clicked.connect(lambda: QDesktopServices.openUrl(QUrl(self._geo_url)))
@@ -3771,25 +4396,75 @@ class NewtonResultDialog(QDialog):
 # +++++++++++++++++++++++++++
 # Splash Screen (pantalla de carga)
 # +++++++++++++++++++++++++++
+# Carpetas de recursos, en orden de prioridad y sin duplicados (cwd suele ser la
+# raíz del proyecto). Cuando se ejecuta como ejecutable (PyInstaller onefile), los
+# recursos se extraen en sys._MEIPASS, que va primero si existe.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_RESOURCE_DIRS = tuple(dict.fromkeys(
+    b for b in (getattr(sys, '_MEIPASS', None), os.getcwd(), _HERE, os.path.dirname(_HERE)) if b
+))
+
+
+@lru_cache(maxsize=64)
 def _resource_path(name: str) -> str:
-    """Busca 'name' en: cwd, carpeta del módulo y raíz del proyecto."""
-    here = os.path.dirname(__file__)
-    # Cuando se ejecuta como ejecutable (PyInstaller onefile), los recursos se
-    # extraen temporalmente en sys._MEIPASS. Lo probamos primero si existe.
-    meipass = getattr(sys, '_MEIPASS', None)
-    candidates = [
-        os.path.join(meipass, name) if meipass else None,
-        os.path.join(os.getcwd(), name),
-        os.path.join(here, name),
-        os.path.join(os.path.dirname(here), name),
-    ]
-    for p in candidates:
-        if not p:
-            continue
-        if os.path.exists(p):
+    """Busca el archivo 'name' en _RESOURCE_DIRS: _MEIPASS, cwd, carpeta del módulo y raíz.
+
+    Cacheada: las carpetas candidatas se fijan al importar el módulo.
+    """
+    for base in _RESOURCE_DIRS:
+        p = os.path.join(base, name)
+        if os.path.isfile(p):
             return p
     return name  # Qt intentará resolverlo igualmente
 
+
+def _splash_animations_enabled() -> bool:
+    """False en pantallas sin composición por GPU: offscreen/minimal/VNC, escritorio
+    remoto de Windows o HK_MATRIX_NO_SPLASH_ANIM=1. Ahí los fundidos solo cuestan repintados."""
+    if os.environ.get('HK_MATRIX_NO_SPLASH_ANIM') == '1':
+        return False
+    if QApplication.platformName() in ('offscreen', 'minimal', 'vnc', 'linuxfb'):
+        return False
+    if _ctypes is not None:
+        try:
+            if _ctypes.windll.user32.GetSystemMetrics(0x1000):  # SM_REMOTESESSION
+                return False
+        except Exception:
+            pass
+    return True
+
+
+# Hoja de estilo del splash (constante de módulo)
+_SPLASH_QSS = """
+QFrame#splashFrame {
+    background-color: #1e1e2e;
+    border: 1px solid #2b2d31;
+    border-radius: 18px;
+}
+QLabel#splashTitle {
+    font-size: 18px;
+    font-weight: 800;
+    color: #ffffff;
+    letter-spacing: 3px;
+}
+QLabel#splashSub   {
+    font-size: 11px;
+    color: #a78bfa;
+}
+QProgressBar {
+    background-color: #2a2a3e;
+    border: 1px solid #32324a;
+    border-radius: 4px;
+    height: 10px;
+}
+QProgressBar::chunk {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #7f5af0, stop:1 #9b6bff);
+    border-radius: 4px;
+}
+"""
+
+
 class SplashScreen(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -3798,48 +4473,19 @@ class SplashScreen(QWidget):
         )
         self.setAttribute(Qt.WA_TranslucentBackground, True)
 
-        # Contenedor con esquinas redondeadas y sombra
+        # Contenedor con esquinas redondeadas. Sin QGraphicsDropShadowEffect: el marco
+        # ocupa toda la ventana (la sombra quedaba recortada) y el efecto obligaba a
+        # re-difuminar el subárbol en cada frame de la barra animada.
         frame = QFrame(self)
         frame.setObjectName("splashFrame")
-        frame.setStyleSheet("""
-            QFrame#splashFrame {
-                background-color: #1e1e2e;
-                border: 1px solid #2b2d31;
-                border-radius: 18px;
-            }
-            QLabel#splashTitle {
-                font-size: 18px;
-                font-weight: 800;
-                color: #ffffff;
-                letter-spacing: 3px;
-            }
-            QLabel#splashSub   {
-                font-size: 11px;
-                color: #a78bfa;
-            }
-            QProgressBar {
-                background-color: #2a2a3e;
-                border: 1px solid #32324a;
-                border-radius: 4px;
-                height: 10px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #7f5af0, stop:1 #9b6bff);
-                border-radius: 4px;
-            }
-        """)
-        eff = QGraphicsDropShadowEffect(self)
-        eff.setBlurRadius(28); eff.setOffset(0, 8); eff.setColor(QColor(0, 0, 0, 180))
-        frame.setGraphicsEffect(eff)
+        frame.setStyleSheet(_SPLASH_QSS)
 
         lay = QVBoxLayout(frame); lay.setContentsMargins(22, 20, 22, 18); lay.setSpacing(10)
 
         # Logo
         logo = QLabel()
-        pix = QPixmap(_resource_path("logo.png"))
+        pix = _logo_pixmap(96)
         if not pix.isNull():
-            pix = pix.scaled(96, 96, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             logo.setPixmap(pix)
         logo.setAlignment(Qt.AlignCenter)
         lay.addWidget(logo, 0, Qt.AlignCenter)
@@ -3854,8 +4500,10 @@ class SplashScreen(QWidget):
         sub.setAlignment(Qt.AlignCenter)
         lay.addWidget(sub)
 
+        # Barra determinada por etapas: el modo indeterminado (0, 0) mantenía un
+        # temporizador de animación repintando durante todo el arranque
         self.bar = QProgressBar()
-        self.bar.setRange(0, 0)  # indeterminado
+        self.bar.setRange(0, 100); self.bar.setValue(0); self.bar.setTextVisible(False)
         lay.addWidget(self.bar)
 
         # Tamaño y centrado
@@ -3865,8 +4513,9 @@ class SplashScreen(QWidget):
         scr = QApplication.primaryScreen().geometry()
         self.move(int(scr.center().x() - self.width()/2), int(scr.center().y() - self.height()/2))
 
-        # Animaciones
-        self.setWindowOpacity(0.0)
+        # Animaciones (se omiten en pantallas sin aceleración)
+        self._animate = _splash_animations_enabled()
+        self.setWindowOpacity(0.0 if self._animate else 1.0)
         self._fade_in = QPropertyAnimation(self, b"windowOpacity")
         self._fade_in.setDuration(300)
         self._fade_in.setStartValue(0.0)
@@ -3878,37 +4527,51 @@ class SplashScreen(QWidget):
         self._fade_out.setStartValue(1.0)
         self._fade_out.setEndValue(0.0)
         self._fade_out.setEasingCurve(QEasingCurve.InCubic)
-        self._fade_out.finished.connect(self.close)
+        # Una sola conexión; finish() solo deja el callback pendiente
+        self._after = None
+        self._fade_out.finished.connect(self._on_fade_out_finished)
 
     def start(self):
         self.show()
-        self._fade_in.start()
+        if self._animate:
+            self._fade_in.start()
+
+    def set_progress(self, pct: int):
+        self.bar.setValue(int(pct))
 
     def finish(self, after: callable | None = None):
-        def done():
-            if callable(after):
-                after()
-        self._fade_out.finished.connect(done)
-        self._fade_out.start()
+        self._after = after
+        if self._animate:
+            self._fade_out.start()
+        else:
+            self._on_fade_out_finished()
+
+    def _on_fade_out_finished(self):
+        self.close()
+        cb, self._after = self._after, None
+        if callable(cb):
+            cb()
 
 
 def run():
     # En Windows, establece un AppUserModelID explícito para que la barra de tareas
     # use el icono de la ventana (logo.png) en lugar del icono de python.exe y para
     # que el agrupado sea independiente si el usuario fija la app.
-    if sys.platform == 'win32':
+    # Se fija una sola vez por proceso aunque run() se llame varias veces.
+    global _APP_ID_SET
+    if _ctypes is not None and not _APP_ID_SET:
         try:
-            import ctypes  # lazy import para evitar dependencia en otros SO
-            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
+            _ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
                 'hk_matrix.matrix_app'
             )
+            _APP_ID_SET = True
         except Exception:
             pass
     app = QApplication(sys.argv)
 
     # Icono global para que Windows muestre el logo en la barra de tareas y miniaturas
     try:
-        app.setWindowIcon(QIcon(_resource_path('logo.png')))
+        app.setWindowIcon(_logo_icon())
     except Exception:
         pass
 
@@ -3923,20 +4586,26 @@ def run():
     def launch_main_after_welcome():
         nonlocal main_window, welcome
 
-        # Splash de carga
+        # Splash de carga: se pinta y arranca el fade-in al volver al bucle de eventos
         splash = SplashScreen()
         splash.start()
-        app.processEvents()
+        splash.set_progress(10)
 
-        # Construir la ventana principal si aún no existe
-        if main_window is None:
-            main_window = MatrixQtApp()
+        # Construir la ventana principal si aún no existe (fuera del primer frame del splash)
+        def _build_main():
+            nonlocal main_window
+            if main_window is None:
+                main_window = MatrixQtApp()
+            splash.set_progress(80)
 
-        # Cerrar splash con fade-out y mostrar la app
+        # Cerrar splash con fade-out y mostrar la app; el splash dura
+        # max(700 ms, construcción) en lugar de construcción + 700 ms
         def _show_main():
-            if main_window is not None:
-                main_window.showMaximized()
+            _build_main()
+            splash.set_progress(100)
+            main_window.showMaximized()
             splash.finish()
+        QTimer.singleShot(0, _build_main)
         QTimer.singleShot(700, _show_main)
 
     # Sobrescribimos el handler del botón de entrada para encadenar la transición